@@ -48,6 +48,7 @@ class ImpliedDistribution:
     kurtosis: float
     atm_iv: float
     days_to_exp: int
+    current_price: float = 0.0
     
     def probability_between(self, low: float, high: float) -> float:
         """Calculate probability of price between low and high"""
@@ -333,7 +334,8 @@ class BreedenLitzenberger:
             skewness=skewness,
             kurtosis=kurtosis,
             atm_iv=atm_iv,
-            days_to_exp=days_to_exp
+            days_to_exp=days_to_exp,
+            current_price=current_price
         )
     
     def _clean_options(self, options: pd.DataFrame, current_price: float,
@@ -493,20 +495,22 @@ class OptionsAnalyzer:
     def _add_greeks(self, options: pd.DataFrame, S: float, T: float,
                     option_type: str) -> pd.DataFrame:
         """Add Greeks columns to options dataframe"""
-        greeks_list = []
+        # Preallocated typed columns filled by index (no per-row dicts / dtype inference)
+        greeks = np.zeros(len(options), dtype=[('delta', 'f8'), ('gamma', 'f8'), ('theta', 'f8'),
+                                               ('vega', 'f8'), ('rho', 'f8')])
         
-        for _, row in options.iterrows():
-            K = row['strike']
-            sigma = row.get('impliedVolatility', 0.3)
-            
+        strikes = options['strike'].to_numpy(dtype=float)
+        if 'impliedVolatility' in options:
+            ivs = options['impliedVolatility'].to_numpy(dtype=float)
+        else:
+            ivs = np.full(len(options), 0.3)
+        
+        for i, (K, sigma) in enumerate(zip(strikes, ivs)):
             if sigma > 0 and T > 0:
                 g = self.bs.greeks(S, K, T, self.r, sigma, option_type)
-                greeks_list.append(g.to_dict())
-            else:
-                greeks_list.append({'delta': 0, 'gamma': 0, 'theta': 0, 
-                                    'vega': 0, 'rho': 0})
+                greeks[i] = (g.delta, g.gamma, g.theta, g.vega, g.rho)
         
-        greeks_df = pd.DataFrame(greeks_list)
+        greeks_df = pd.DataFrame(greeks)
         return pd.concat([options.reset_index(drop=True), greeks_df], axis=1)
     
     def _extract_iv_surface(self, calls: pd.DataFrame, puts: pd.DataFrame,
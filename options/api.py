@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 
 from central_portfolio import get_central_portfolio
 from correlation_analysis import CorrelationAnalyzer
+from kernels import corr_matrix
 
 app = FastAPI(title="Portfolio Terminal API")
 
@@ -105,12 +106,12 @@ def get_portfolio_analytics():
 
         tickers = portfolio.get_unique_tickers()
 
-        # Get beta history for each ticker
+        # Beta history and correlations reuse the price history the analysis just loaded
         beta_history = []
-        for ticker in tickers:
-            try:
-                beta_result = corr_analyzer.rolling_beta(ticker, 'SPY', period='1y', window=60)
-                beta_df = beta_result.rolling_beta.reset_index()
+        try:
+            betas = corr_analyzer.rolling_betas(portfolio.price_history(), 'SPY')
+            for ticker in [t for t in tickers if t in betas.columns]:
+                beta_df = betas[ticker].dropna().reset_index()
                 beta_df.columns = ['date', 'beta']
                 beta_df['date'] = beta_df['date'].astype(str)
 
@@ -118,15 +119,16 @@ def get_portfolio_analytics():
                     'ticker': ticker,
                     'data': beta_df.to_dict('records')
                 })
-            except:
-                pass
+        except:
+            pass
 
         # Get correlation matrix
         try:
-            prices = corr_analyzer.fetch_price_data(tickers, period='1y')
+            history = portfolio.price_history()
+            prices = history[[t for t in tickers if t in history.columns]]  # Skip failed downloads
             returns = corr_analyzer.calculate_returns(prices)
-            corr_matrix = returns.corr()
-            correlation_matrix = corr_matrix.values.tolist()
+            # float32 corrcoef, rounded - the heatmap only shows a few decimals
+            correlation_matrix = np.round(corr_matrix(returns.to_numpy()).astype(float), 4).tolist()
         except:
             correlation_matrix = []
 
@@ -170,13 +172,12 @@ def get_stock_detail(ticker: str):
         hist = stock.history(period='1y')
 
         if not hist.empty:
-            price_history = []
-            for date, row in hist.iterrows():
-                price_history.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'price': float(row['Close']),
-                    'volume': int(row['Volume'])
-                })
+            # Built column-wise instead of one dict per iterrows() row
+            price_history = pd.DataFrame({
+                'date': hist.index.strftime('%Y-%m-%d'),
+                'price': hist['Close'].to_numpy(dtype=float),
+                'volume': hist['Volume'].to_numpy(dtype=np.int64)
+            }).to_dict('records')
         else:
             price_history = []
 
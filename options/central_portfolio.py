@@ -83,6 +83,20 @@ class CentralPortfolio:
         self._analytics_cache = {}
         self._cache_timestamp = None
         self._cache_ttl = 300  # 5 minutes
+        self._cache_key = None  # positions the cached analytics were computed for
+
+        # Sorted unique tickers - only changes on mutation, so it is not TTL-bound
+        self._tickers = None
+
+        # Positions with live quotes - reused across reruns for a minute
+        self._pnl_cache = None
+        self._pnl_timestamp = None
+        self._pnl_ttl = 60
+        self._summary_cache = None
+        self._summary_key = None
+
+        # Bumped on every mutation - a cheap key for anything derived from the positions
+        self.version = 0
 
     @property
     def options_analyzer(self):
@@ -109,6 +123,7 @@ class CentralPortfolio:
         """Add stock position and reload"""
         self.portfolio.add_stock(ticker, quantity, entry_price, notes)
         self.portfolio.load()  # CRITICAL: Reload from disk
+        self.version += 1
         self._invalidate_cache()
 
     def add_option(self, ticker: str, option_type: str, quantity: int,
@@ -117,43 +132,90 @@ class CentralPortfolio:
         self.portfolio.add_option(ticker, option_type, quantity, entry_price,
                                  strike, expiration, notes)
         self.portfolio.load()  # CRITICAL: Reload from disk
+        self.version += 1
         self._invalidate_cache()
 
     def remove_position(self, index: int):
         """Remove position and reload"""
         self.portfolio.remove_position(index)
         self.portfolio.load()  # CRITICAL: Reload from disk
+        self.version += 1
         self._invalidate_cache()
 
     def clear(self):
         """Clear all positions and reload"""
         self.portfolio.clear()
         self.portfolio.load()  # CRITICAL: Reload from disk
+        self.version += 1
         self._invalidate_cache()
 
     def _invalidate_cache(self):
-        """Invalidate analytics cache"""
+        """Invalidate every derived cache after a position change (analytics, tickers, quotes)"""
+        self._expire_analytics()
+        self._cache_key = None
+        self._tickers = None
+        self._pnl_cache = None
+
+    def _expire_analytics(self):
+        """Drop the TTL-bound analytics cache; quotes keep their own 60s TTL"""
         self._analytics_cache = {}
         self._cache_timestamp = None
 
+    def _positions_key(self) -> tuple:
+        """Cheap fingerprint of the positions - analytics only change when this does"""
+        return tuple((p.ticker, p.position_type, p.quantity, p.entry_price, p.strike, p.expiration)
+                     for p in self.portfolio.positions)
+
+    def _reset_stale_cache(self):
+        """
+        Drop caches the validity check rejected.
+
+        Past the TTL only the analytics are recomputed; a fingerprint mismatch
+        means the positions changed, so the tickers and quotes go too.
+        """
+        if self._cache_key is not None and self._cache_key != self._positions_key():
+            self._invalidate_cache()
+        else:
+            self._expire_analytics()
+
     def _is_cache_valid(self) -> bool:
-        """Check if cache is still valid"""
-        if self._cache_timestamp is None:
+        """Check if cache is still valid (same positions, within TTL)"""
+        if self._cache_timestamp is None or self._cache_key != self._positions_key():
             return False
-        age = (datetime.now() - self._cache_timestamp).seconds
+        age = (datetime.now() - self._cache_timestamp).total_seconds()
         return age < self._cache_ttl
 
+    def _current_pnl(self) -> pd.DataFrame:
+        """Cached P&L frame, refreshed once its quotes are older than the TTL"""
+        if (self._pnl_cache is None or
+                (datetime.now() - self._pnl_timestamp).total_seconds() >= self._pnl_ttl):
+            self._pnl_cache = self.portfolio.calculate_pnl()
+            self._pnl_timestamp = datetime.now()
+        return self._pnl_cache
+
     def get_positions_df(self) -> pd.DataFrame:
-        """Get positions as DataFrame with current prices and P&L"""
-        return self.portfolio.calculate_pnl()
+        """Get positions as DataFrame with current prices and P&L (quotes cached for 60s)"""
+        return self._current_pnl().copy()
+
+    def positions_key(self) -> tuple:
+        """Key for the current positions/quotes snapshot (changes on any mutation or quote refresh)"""
+        self._current_pnl()
+        return (self.version, self._pnl_timestamp)
 
     def get_portfolio_summary(self) -> Dict:
-        """Get basic portfolio summary"""
-        return self.portfolio.summary()
+        """Get basic portfolio summary (recomputed only for new positions or quotes)"""
+        pnl_df = self._current_pnl()
+        key = self.positions_key()
+        if self._summary_key != key:
+            self._summary_cache = self.portfolio.summary(pnl_df)
+            self._summary_key = key
+        return dict(self._summary_cache)
 
     def get_unique_tickers(self) -> List[str]:
-        """Get list of unique tickers"""
-        return self.portfolio.get_unique_tickers()
+        """Get sorted list of unique tickers (cached until the next mutation)"""
+        if self._tickers is None:
+            self._tickers = tuple(sorted(self.portfolio.get_unique_tickers()))
+        return list(self._tickers)
 
     def analyze_portfolio(self, force_refresh: bool = False) -> PortfolioAnalytics:
         """
@@ -167,17 +229,20 @@ class CentralPortfolio:
         - Risk metrics (VaR, volatility)
         - Expected moves
 
-        Results are cached for 5 minutes unless force_refresh=True
+        Results are cached for 5 minutes (and only while the positions are
+        unchanged) unless force_refresh=True
         """
-        # Check cache
-        if not force_refresh and self._is_cache_valid() and 'analytics' in self._analytics_cache:
+        # Check cache (stale or keyed to other positions -> drop what that invalidates)
+        if not self._is_cache_valid():
+            self._reset_stale_cache()
+        elif not force_refresh and 'analytics' in self._analytics_cache:
             return self._analytics_cache['analytics']
 
         print("Calculating comprehensive portfolio analytics...")
 
         # Get basic metrics
-        summary = self.portfolio.summary()
-        pnl_df = self.portfolio.calculate_pnl()
+        pnl_df = self.get_positions_df()
+        summary = self.get_portfolio_summary()
 
         if pnl_df.empty:
             return self._empty_analytics()
@@ -192,7 +257,7 @@ class CentralPortfolio:
             greeks = {'delta': 0, 'gamma': 0, 'theta': 0, 'vega': 0}
 
         # Calculate portfolio beta (value-weighted)
-        portfolio_beta = self._calculate_portfolio_beta(pnl_df, tickers)
+        portfolio_beta = self.portfolio_beta(pnl_df, force_refresh=force_refresh)
 
         # Calculate correlation metrics
         corr_metrics = self._calculate_correlation_metrics(tickers, pnl_df)
@@ -242,11 +307,45 @@ class CentralPortfolio:
         # Cache results
         self._analytics_cache['analytics'] = analytics
         self._cache_timestamp = datetime.now()
+        self._cache_key = self._positions_key()
 
         print("✓ Portfolio analytics calculated")
 
         return analytics
 
+    def portfolio_beta(self, pnl_df: Optional[pd.DataFrame] = None,
+                       force_refresh: bool = False) -> float:
+        """
+        Value-weighted portfolio beta on its own.
+
+        Much cheaper than analyze_portfolio() when only beta is needed
+        (e.g. the overview header). Shares the analytics cache, so it is
+        invalidated on every portfolio mutation.
+        """
+        if not self._is_cache_valid():
+            self._reset_stale_cache()
+        elif force_refresh:
+            # Re-download the history; otherwise a missing 'beta' is rebuilt from the cached betas/prices
+            for key in ('betas', 'prices', 'returns'):
+                self._analytics_cache.pop(key, None)
+        elif 'beta' in self._analytics_cache:
+            return self._analytics_cache['beta']
+
+        if pnl_df is None:
+            pnl_df = self.get_positions_df()
+
+        if pnl_df.empty:
+            return 1.0
+
+        beta = self._calculate_portfolio_beta(pnl_df, self.get_unique_tickers())
+
+        self._analytics_cache['beta'] = beta
+        if self._cache_timestamp is None:
+            self._cache_timestamp = datetime.now()
+            self._cache_key = self._positions_key()
+
+        return beta
+
     def _empty_analytics(self) -> PortfolioAnalytics:
         """Return empty analytics for empty portfolio"""
         return PortfolioAnalytics(
@@ -258,6 +357,49 @@ class CentralPortfolio:
             largest_positions=[], highest_risk_positions=[], alerts=[]
         )
 
+    def price_history(self) -> pd.DataFrame:
+        """
+        1y closes for the portfolio tickers + SPY, downloaded once per analysis.
+
+        Betas, correlations, VaR and expected moves all read this frame
+        instead of each fetching the same history. Shares the analytics
+        cache, so it is invalidated on every portfolio mutation.
+        """
+        if 'prices' not in self._analytics_cache:
+            symbols = sorted(set(self.get_unique_tickers()) | {'SPY'})
+            # Unaligned: each ticker keeps its own history; joint metrics drop rows themselves
+            self._analytics_cache['prices'] = self.corr_analyzer.fetch_price_data(
+                symbols, period='1y', align=False
+            )
+        return self._analytics_cache['prices']
+
+    def returns_history(self) -> pd.DataFrame:
+        """Log returns of price_history(), derived once and shared by the risk metrics"""
+        if 'returns' not in self._analytics_cache:
+            self._analytics_cache['returns'] = self.corr_analyzer.calculate_returns(self.price_history())
+        return self._analytics_cache['returns']
+
+    def _current_betas(self, tickers: List[str]) -> Dict[str, float]:
+        """Latest rolling beta vs SPY per ticker (1.0 where unavailable)"""
+        if 'betas' in self._analytics_cache:
+            return self._analytics_cache['betas']
+
+        betas = {}
+        try:
+            table = self.corr_analyzer.rolling_betas(self.price_history(), 'SPY')
+            if not table.empty:
+                latest = table.ffill().iloc[-1]  # A ticker's series may end before the others'
+                betas = {t: float(b) for t, b in latest.items() if np.isfinite(b)}
+        except Exception as e:
+            print(f"Beta calculation failed: {e}")
+
+        missing = [t for t in tickers if t not in betas]
+        if missing:
+            print(f"⚠️ Not enough history for a beta - using 1.0 for: {', '.join(missing)}")
+        betas = {t: betas.get(t, 1.0) for t in tickers}  # Default to market beta
+        self._analytics_cache['betas'] = betas
+        return betas
+
     def _calculate_portfolio_beta(self, pnl_df: pd.DataFrame, tickers: List[str]) -> float:
         """Calculate value-weighted portfolio beta"""
         try:
@@ -265,21 +407,13 @@ class CentralPortfolio:
             if total_value == 0:
                 return 1.0
 
+            betas = self._current_betas(tickers)
+            ticker_values = pnl_df.groupby('ticker')['market_value'].sum()
+
             weighted_beta = 0
             for ticker in tickers:
-                # Get positions for this ticker
-                ticker_positions = pnl_df[pnl_df['ticker'] == ticker]
-                ticker_value = ticker_positions['market_value'].sum()
-                weight = ticker_value / total_value
-
-                # Get beta
-                try:
-                    beta_result = self.corr_analyzer.rolling_beta(ticker, 'SPY', period='1y')
-                    beta = beta_result.current_beta
-                except:
-                    beta = 1.0  # Default to market beta
-
-                weighted_beta += weight * beta
+                weight = ticker_values.get(ticker, 0) / total_value
+                weighted_beta += weight * betas[ticker]
 
             return weighted_beta
         except:
@@ -292,23 +426,18 @@ class CentralPortfolio:
             return {'avg_correlation': 0, 'diversification_ratio': 1.0}
 
         try:
-            # Get weights
-            total_value = pnl_df['market_value'].sum()
-            weights = []
-            tickers_clean = []
-
-            for ticker in tickers:
-                ticker_value = pnl_df[pnl_df['ticker'] == ticker]['market_value'].sum()
-                if ticker_value > 0:
-                    weights.append(ticker_value / total_value)
-                    tickers_clean.append(ticker)
+            # Get weights (tickers with a positive market value)
+            values = pnl_df.groupby('ticker')['market_value'].sum().reindex(tickers, fill_value=0)
+            values = values[values > 0]
+            tickers_clean = values.index.tolist()
+            weights = (values / pnl_df['market_value'].sum()).tolist()
 
             if len(tickers_clean) < 2:
                 return {'avg_correlation': 0, 'diversification_ratio': 1.0}
 
             # Calculate diversification metrics
             metrics = self.corr_analyzer.analyze_portfolio_diversification(
-                tickers_clean, weights, period='1y'
+                tickers_clean, weights, period='1y', prices=self.price_history()
             )
 
             return {
@@ -318,31 +447,32 @@ class CentralPortfolio:
         except:
             return {'avg_correlation': 0, 'diversification_ratio': 1.0}
 
+    @staticmethod
+    def _ticker_weights(pnl_df: pd.DataFrame) -> pd.Series:
+        """Share of total market value held in each ticker"""
+        return pnl_df.groupby('ticker')['market_value'].sum() / pnl_df['market_value'].sum()
+
+    def _portfolio_returns(self, returns: pd.DataFrame, pnl_df: pd.DataFrame) -> np.ndarray:
+        """Value-weighted daily portfolio returns (R @ w, weights aligned to the return columns)"""
+        weights = self._ticker_weights(pnl_df).reindex(returns.columns, fill_value=0)
+        return returns.to_numpy() @ weights.to_numpy()
+
     def _calculate_risk_metrics(self, tickers: List[str], pnl_df: pd.DataFrame) -> Dict:
         """Calculate VaR and volatility"""
         try:
-            # Fetch historical data
-            prices = self.corr_analyzer.fetch_price_data(tickers, period='1y')
-            returns = self.corr_analyzer.calculate_returns(prices)
+            # Shared historical data
+            returns = self.returns_history()
 
-            # Get weights
             total_value = pnl_df['market_value'].sum()
-            weights = []
-
-            for ticker in tickers:
-                ticker_value = pnl_df[pnl_df['ticker'] == ticker]['market_value'].sum()
-                weights.append(ticker_value / total_value)
-
-            weights = np.array(weights)
 
-            # Portfolio returns
-            portfolio_returns = (returns * weights).sum(axis=1)
+            # Portfolio returns: one matrix-vector product over the history
+            portfolio_returns = self._portfolio_returns(returns, pnl_df)
 
             # VaR (95%)
             var_95 = np.percentile(portfolio_returns, 5) * total_value
 
             # Volatility (annualized)
-            volatility = portfolio_returns.std() * np.sqrt(252)
+            volatility = portfolio_returns.std(ddof=1) * np.sqrt(252)
 
             return {
                 'var_95': abs(var_95),
@@ -357,20 +487,12 @@ class CentralPortfolio:
             total_value = pnl_df['market_value'].sum()
 
             # Simple volatility-based estimate
-            prices = self.corr_analyzer.fetch_price_data(tickers, period='1y')
-            returns = self.corr_analyzer.calculate_returns(prices)
+            returns = self.returns_history()
 
-            # Get weights
-            weights = []
-            for ticker in tickers:
-                ticker_value = pnl_df[pnl_df['ticker'] == ticker]['market_value'].sum()
-                weights.append(ticker_value / total_value)
-
-            weights = np.array(weights)
-            portfolio_returns = (returns * weights).sum(axis=1)
+            portfolio_returns = self._portfolio_returns(returns, pnl_df)
 
             # Daily std
-            daily_std = portfolio_returns.std()
+            daily_std = portfolio_returns.std(ddof=1)
             weekly_std = daily_std * np.sqrt(5)
 
             # Expected moves (1 std)
@@ -392,48 +514,28 @@ class CentralPortfolio:
 
     def _get_largest_positions(self, pnl_df: pd.DataFrame, n: int = 5) -> List[Dict]:
         """Get N largest positions by value"""
-        sorted_df = pnl_df.sort_values('market_value', ascending=False).head(n)
-
-        results = []
-        for _, row in sorted_df.iterrows():
-            results.append({
-                'ticker': row['ticker'],
-                'type': row['type'],
-                'value': row['market_value'],
-                'pnl': row['pnl'],
-                'pnl_pct': row['pnl_pct']
-            })
+        top = pnl_df.nlargest(n, 'market_value')
 
-        return results
+        return top[['ticker', 'type', 'market_value', 'pnl', 'pnl_pct']].rename(
+            columns={'market_value': 'value'}
+        ).to_dict('records')
 
     def _get_highest_risk_positions(self, pnl_df: pd.DataFrame,
                                     portfolio_beta: float, n: int = 5) -> List[Dict]:
         """Get N highest risk positions (by beta * value)"""
-        results = []
-
-        for _, row in pnl_df.iterrows():
-            try:
-                beta_result = self.corr_analyzer.rolling_beta(
-                    row['ticker'], 'SPY', period='1y'
-                )
-                beta = beta_result.current_beta
-            except:
-                beta = 1.0
-
-            risk_score = beta * row['market_value']
-
-            results.append({
-                'ticker': row['ticker'],
-                'type': row['type'],
-                'value': row['market_value'],
-                'beta': beta,
-                'risk_score': risk_score
-            })
+        betas = self._current_betas(self.get_unique_tickers())
 
-        # Sort by risk score
-        results.sort(key=lambda x: x['risk_score'], reverse=True)
+        # Column-wise: one map for the betas, one multiply for the scores
+        beta = pnl_df['ticker'].map(betas).fillna(1.0)
+        risk = pd.DataFrame({
+            'ticker': pnl_df['ticker'],
+            'type': pnl_df['type'],
+            'value': pnl_df['market_value'],
+            'beta': beta,
+            'risk_score': beta * pnl_df['market_value']
+        })
 
-        return results[:n]
+        return risk.nlargest(n, 'risk_score').to_dict('records')
 
     def _generate_alerts(self, pnl_df: pd.DataFrame, greeks: Dict,
                         portfolio_beta: float, corr_metrics: Dict) -> List[str]:
@@ -490,6 +592,7 @@ class CentralPortfolio:
             pos = Position.from_dict(pos_dict)
             self.portfolio.add_position(pos)
 
+        self.version += 1
         self._invalidate_cache()
 
 
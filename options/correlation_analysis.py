@@ -15,6 +15,7 @@ import warnings
 warnings.filterwarnings('ignore')
 
 from config import PLOTS_DIR
+from kernels import rolling_beta_table, rolling_regression, rolling_corr, rolling_corr_table, corr_matrix
 import os
 
 
@@ -31,6 +32,13 @@ class RollingBeta:
     avg_beta: float
     beta_std: float
 
+    def __post_init__(self):
+        # Contiguous float32 SoA - plotting and arithmetic consume these directly
+        self.dates = np.asarray(self.dates)
+        self.betas = np.ascontiguousarray(self.betas, dtype=np.float32)
+        self.alphas = np.ascontiguousarray(self.alphas, dtype=np.float32)
+        self.r_squared = np.ascontiguousarray(self.r_squared, dtype=np.float32)
+
     def get_regime(self) -> str:
         """Classify current beta regime"""
         if self.current_beta > self.avg_beta + self.beta_std:
@@ -52,14 +60,17 @@ class CorrelationMatrix:
 
     def get_pairs_by_correlation(self, threshold: float = 0.7) -> List[Tuple[str, str, float]]:
         """Get ticker pairs above correlation threshold"""
-        pairs = []
-        n = len(self.tickers)
-        for i in range(n):
-            for j in range(i + 1, n):
-                corr = self.correlation_matrix.iloc[i, j]
-                if abs(corr) >= threshold:
-                    pairs.append((self.tickers[i], self.tickers[j], corr))
-        return sorted(pairs, key=lambda x: abs(x[2]), reverse=True)
+        C = self.correlation_matrix.to_numpy()
+
+        # Upper triangle mask in one pass instead of an O(N²) Python sweep
+        i_idx, j_idx = np.nonzero(np.triu(np.abs(C) >= threshold, k=1))
+        tickers_arr = np.asarray(self.tickers)
+
+        pairs = list(zip(tickers_arr[i_idx].tolist(),
+                         tickers_arr[j_idx].tolist(),
+                         C[i_idx, j_idx].tolist()))
+        pairs.sort(key=lambda x: -abs(x[2]))
+        return pairs
 
 
 class CorrelationAnalyzer:
@@ -87,7 +98,8 @@ class CorrelationAnalyzer:
         self.window = window
         self.min_periods = min_periods
 
-    def fetch_price_data(self, tickers: List[str], period: str = '2y') -> pd.DataFrame:
+    def fetch_price_data(self, tickers: List[str], period: str = '2y',
+                         align: bool = True) -> pd.DataFrame:
         """
         Fetch historical price data for multiple tickers.
 
@@ -97,6 +109,9 @@ class CorrelationAnalyzer:
             List of ticker symbols
         period : str
             Historical period ('1y', '2y', '5y', 'max')
+        align : bool
+            Drop rows where any ticker is missing (False keeps each ticker's
+            own forward-filled history, so a short one doesn't trim the rest)
 
         Returns:
         --------
@@ -104,18 +119,22 @@ class CorrelationAnalyzer:
         """
         print(f"Fetching data for {len(tickers)} tickers...")
 
+        # One multi-symbol request - yfinance runs the per-ticker HTTP calls concurrently
+        try:
+            closes = yf.download(list(tickers), period=period, threads=True,
+                                 progress=False, auto_adjust=True)['Close']
+        except Exception as e:
+            print(f"  ✗ Download failed - {e}")
+            closes = pd.DataFrame()
+
         data = {}
         for ticker in tickers:
-            try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period=period)
-                if not hist.empty:
-                    data[ticker] = hist['Close']
-                    print(f"  ✓ {ticker}: {len(hist)} days")
-                else:
-                    print(f"  ✗ {ticker}: No data")
-            except Exception as e:
-                print(f"  ✗ {ticker}: Error - {e}")
+            series = closes[ticker].dropna() if ticker in closes.columns else pd.Series(dtype=float)
+            if not series.empty:
+                data[ticker] = closes[ticker]
+                print(f"  ✓ {ticker}: {len(series)} days")
+            else:
+                print(f"  ✗ {ticker}: No data")
 
         if not data:
             raise ValueError("No data fetched for any ticker")
@@ -126,7 +145,8 @@ class CorrelationAnalyzer:
         df = df.fillna(method='ffill', limit=5)
 
         # Drop rows with any remaining NaN
-        df = df.dropna()
+        if align:
+            df = df.dropna()
 
         print(f"\nFinal dataset: {len(df)} days, {len(df.columns)} tickers")
 
@@ -177,15 +197,17 @@ class CorrelationAnalyzer:
         returns = self.calculate_returns(prices)
 
         # Calculate rolling correlation
-        rolling_corr = returns[ticker1].rolling(
-            window=self.window,
-            min_periods=self.min_periods
-        ).corr(returns[ticker2])
+        corr = pd.Series(
+            rolling_corr(returns[ticker1].to_numpy(), returns[ticker2].to_numpy(),
+                         self.window, self.min_periods),
+            index=returns.index
+        )
 
-        return rolling_corr.dropna()
+        return corr.dropna()
 
     def rolling_correlation_matrix(self, tickers: List[str],
-                                   period: str = '2y') -> CorrelationMatrix:
+                                   period: str = '2y',
+                                   prices: Optional[pd.DataFrame] = None) -> CorrelationMatrix:
         """
         Calculate rolling correlations for multiple tickers.
 
@@ -195,38 +217,43 @@ class CorrelationAnalyzer:
             List of ticker symbols
         period : str
             Historical period
+        prices : DataFrame, optional
+            Preloaded close prices containing every ticker (skips the download)
 
         Returns:
         --------
         CorrelationMatrix object
         """
         # Fetch data
-        prices = self.fetch_price_data(tickers, period)
+        if prices is None:
+            prices = self.fetch_price_data(tickers, period)
+        else:
+            prices = prices[list(tickers)].dropna()
         returns = self.calculate_returns(prices)
 
-        # Current correlation matrix
-        current_corr = returns.corr()
+        # Current correlation matrix (one float32 corrcoef over the contiguous returns block)
+        current_corr = pd.DataFrame(corr_matrix(returns.to_numpy()),
+                                    index=returns.columns, columns=returns.columns)
 
-        # Calculate rolling correlations for all pairs
+        # Rolling correlations for all pairs from one (T x N x N) kernel pass
         rolling_corrs = {}
         n = len(tickers)
 
         print("\nCalculating rolling correlations...")
+        cols = [returns.columns.get_loc(t) for t in tickers]
+        table = rolling_corr_table(returns.to_numpy()[:, cols], self.window, self.min_periods)
+
         for i in range(n):
             for j in range(i + 1, n):
                 ticker_i = tickers[i]
                 ticker_j = tickers[j]
 
-                roll_corr = returns[ticker_i].rolling(
-                    window=self.window,
-                    min_periods=self.min_periods
-                ).corr(returns[ticker_j])
-
+                roll_corr = pd.Series(table[:, i, j], index=returns.index)
                 rolling_corrs[(ticker_i, ticker_j)] = roll_corr.dropna()
                 print(f"  ✓ {ticker_i} vs {ticker_j}")
 
         # Calculate average correlation
-        avg_corr = current_corr.values[np.triu_indices_from(current_corr.values, k=1)].mean()
+        avg_corr = float(current_corr.values[np.triu_indices_from(current_corr.values, k=1)].mean())
 
         return CorrelationMatrix(
             tickers=tickers,
@@ -237,7 +264,8 @@ class CorrelationAnalyzer:
         )
 
     def rolling_beta(self, ticker: str, benchmark: str = 'SPY',
-                    period: str = '2y') -> RollingBeta:
+                    period: str = '2y',
+                    prices: Optional[pd.DataFrame] = None) -> RollingBeta:
         """
         Calculate rolling beta of ticker vs benchmark.
 
@@ -253,63 +281,31 @@ class CorrelationAnalyzer:
             Benchmark ticker (default SPY)
         period : str
             Historical period
+        prices : DataFrame, optional
+            Preloaded close prices containing both columns (skips the download)
 
         Returns:
         --------
         RollingBeta object
         """
         # Fetch data
-        prices = self.fetch_price_data([ticker, benchmark], period)
+        if prices is None:
+            prices = self.fetch_price_data([ticker, benchmark], period)
+        else:
+            prices = prices[[ticker, benchmark]].dropna()
         returns = self.calculate_returns(prices)
 
-        # Calculate rolling beta, alpha, R²
-        betas = []
-        alphas = []
-        r_squareds = []
-        dates = []
-
         print(f"\nCalculating rolling beta for {ticker} vs {benchmark}...")
 
-        for i in range(self.min_periods, len(returns)):
-            # Get window
-            window_returns = returns.iloc[max(0, i - self.window):i]
-
-            if len(window_returns) < self.min_periods:
-                continue
-
-            y = window_returns[ticker].values
-            x = window_returns[benchmark].values
-
-            # Remove NaN
-            mask = ~(np.isnan(x) | np.isnan(y))
-            x = x[mask]
-            y = y[mask]
-
-            if len(x) < self.min_periods:
-                continue
-
-            # Calculate beta via covariance
-            cov_matrix = np.cov(x, y)
-            beta = cov_matrix[0, 1] / cov_matrix[0, 0]
-
-            # Calculate alpha (Jensen's alpha)
-            alpha = np.mean(y) - beta * np.mean(x)
-
-            # Calculate R²
-            y_pred = alpha + beta * x
-            ss_res = np.sum((y - y_pred) ** 2)
-            ss_tot = np.sum((y - np.mean(y)) ** 2)
-            r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-
-            betas.append(beta)
-            alphas.append(alpha)
-            r_squareds.append(r_squared)
-            dates.append(returns.index[i])
-
-        betas = np.array(betas)
-        alphas = np.array(alphas)
-        r_squareds = np.array(r_squareds)
-        dates = np.array(dates)
+        # Window [i - window, i) is stamped with date i, for i >= min_periods
+        beta, alpha, r_squared = rolling_regression(
+            returns[ticker].to_numpy(), returns[benchmark].to_numpy(),
+            self.window, self.min_periods
+        )
+        betas = beta[self.min_periods - 1:-1]
+        alphas = alpha[self.min_periods - 1:-1]
+        r_squareds = r_squared[self.min_periods - 1:-1]
+        dates = returns.index[self.min_periods:].to_numpy()
 
         print(f"  ✓ Calculated {len(betas)} rolling beta values")
 
@@ -320,14 +316,62 @@ class CorrelationAnalyzer:
             betas=betas,
             alphas=alphas,
             r_squared=r_squareds,
-            current_beta=betas[-1] if len(betas) > 0 else 0,
-            avg_beta=np.mean(betas),
-            beta_std=np.std(betas)
+            current_beta=float(betas[-1]) if len(betas) > 0 else 0,
+            avg_beta=float(np.mean(betas)),
+            beta_std=float(np.std(betas))
         )
 
+    def rolling_betas(self, prices: pd.DataFrame,
+                      benchmark: str = 'SPY') -> pd.DataFrame:
+        """
+        Rolling beta of every column vs benchmark.
+
+        Beta_i = Cov(R_i, F) / Var(F). Tickers whose history covers all the
+        common dates go through the table-mode kernel in one pass, so the
+        benchmark statistics are computed once; a shorter or gappier ticker is
+        regressed on its own overlap with the benchmark, so it doesn't cut
+        every other ticker's window down to its own.
+
+        Parameters:
+        -----------
+        prices : DataFrame
+            Close prices, one column per ticker (must include benchmark);
+            columns may have different start dates or gaps
+        benchmark : str
+            Benchmark ticker (default SPY)
+
+        Returns:
+        --------
+        DataFrame of rolling betas (dates x tickers)
+        """
+        prices = prices.dropna(axis=1, how='all')
+        bench_dates = prices[prices[benchmark].notna()]
+
+        # Columns present on every benchmark date share one table pass
+        complete = bench_dates.notna().all()
+        tables = [self._beta_table(bench_dates.loc[:, complete], benchmark)]
+
+        for ticker in complete.index[~complete]:
+            pair = prices[[ticker, benchmark]].dropna()
+            tables.append(self._beta_table(pair, benchmark)[[ticker]])
+
+        return pd.concat(tables, axis=1)[list(prices.columns)].dropna(how='all')
+
+    def _beta_table(self, prices: pd.DataFrame, benchmark: str) -> pd.DataFrame:
+        """Rolling betas of every column of an aligned (NaN-free) price frame"""
+        returns = self.calculate_returns(prices)
+        returns = returns[np.isfinite(returns.to_numpy()).all(axis=1)]
+
+        arr = returns.to_numpy(dtype=np.float32)
+        betas = rolling_beta_table(arr, arr[:, returns.columns.get_loc(benchmark)],
+                                   self.window, self.min_periods)
+
+        return pd.DataFrame(betas, index=returns.index, columns=returns.columns)
+
     def analyze_portfolio_diversification(self, tickers: List[str],
                                          weights: Optional[List[float]] = None,
-                                         period: str = '2y') -> Dict:
+                                         period: str = '2y',
+                                         prices: Optional[pd.DataFrame] = None) -> Dict:
         """
         Analyze portfolio diversification using correlation analysis.
 
@@ -339,6 +383,8 @@ class CorrelationAnalyzer:
             Position weights (default equal weight)
         period : str
             Historical period
+        prices : DataFrame, optional
+            Preloaded close prices containing every ticker (skips both downloads)
 
         Returns:
         --------
@@ -351,26 +397,26 @@ class CorrelationAnalyzer:
         weights = weights / weights.sum()  # Normalize
 
         # Get correlation matrix
-        corr_matrix = self.rolling_correlation_matrix(tickers, period)
+        if prices is None:
+            prices = self.fetch_price_data(tickers, period)
+        else:
+            prices = prices[list(tickers)].dropna()
+        corr_matrix = self.rolling_correlation_matrix(tickers, period, prices=prices)
 
         # Calculate weighted average correlation
         corr_values = corr_matrix.correlation_matrix.values
         n = len(tickers)
 
-        weighted_corr = 0
-        total_weight = 0
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                pair_weight = weights[i] * weights[j]
-                weighted_corr += pair_weight * corr_values[i, j]
-                total_weight += pair_weight
+        # Pair weights w_i * w_j over the upper triangle
+        iu = np.triu_indices(n, k=1)
+        pair_weights = np.outer(weights, weights)[iu]
+        total_weight = pair_weights.sum()
+        weighted_corr = float(pair_weights @ corr_values[iu])
 
         avg_weighted_corr = weighted_corr / total_weight if total_weight > 0 else 0
 
         # Calculate diversification ratio
         # DR = (sum of weighted individual vols) / (portfolio vol)
-        prices = self.fetch_price_data(tickers, period)
         returns = self.calculate_returns(prices)
 
         individual_vols = returns.std() * np.sqrt(252)  # Annualized
@@ -655,8 +701,8 @@ def quick_beta(ticker: str, benchmark: str = 'SPY', window: int = 60,
     print(f"Current Beta: {beta_result.current_beta:.3f} ({beta_result.get_regime()})")
     print(f"Average Beta: {beta_result.avg_beta:.3f}")
     print(f"Beta Std Dev: {beta_result.beta_std:.3f}")
-    print(f"Current Alpha (annual): {beta_result.alphas[-1] * 252 * 100:.2f}%")
-    print(f"Current R²: {beta_result.r_squared[-1]:.3f}")
+    print(f"Current Alpha (annual): {float(beta_result.alphas[-1]) * 252 * 100:.2f}%")
+    print(f"Current R²: {float(beta_result.r_squared[-1]):.3f}")
 
     if plot:
         viz = CorrelationVisualizer()
@@ -6,18 +6,25 @@ Multi-page dashboard with portfolio overview, analytics, and individual stock dr
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import plotly.graph_objects as go
-import plotly.express as px
+from plotly.colors import qualitative
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import yfinance as yf
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
 from datetime import datetime, timedelta
 from typing import List, Dict
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from central_portfolio import get_central_portfolio, CentralPortfolio
 from analytics import OptionsAnalyzer
 from correlation_analysis import CorrelationAnalyzer
 from forecasting import DistributionForecaster
 from scanner import OptionsScanner, Watchlist
+from kernels import dual_rolling_mean, rolling_mean, rolling_beta_table, log_returns, corr_matrix
 
 # Page config
 st.set_page_config(
@@ -27,24 +34,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for dark theme
-st.markdown("""
-<style>
-    .stApp {
-        background-color: #0a0a0f;
-    }
-    .metric-card {
-        background-color: #1a1a28;
-        padding: 20px;
-        border-radius: 10px;
-        border: 1px solid #2a2a38;
-    }
-    .chart-container {
-        background-color: #1a1a28;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-    }
+# Custom CSS for dark theme - minified once at import, so each run only emits a constant.
+# Colors the theme can express (background, primary) live in .streamlit/config.toml;
+# Streamlit clears elements a rerun does not re-emit, so this block cannot be sent once per session.
+_CSS = """
     h1, h2, h3 {
         color: #ffffff;
     }
@@ -58,8 +51,23 @@ st.markdown("""
     .stButton>button:hover {
         background-color: #4f46e5;
     }
-</style>
-""", unsafe_allow_html=True)
+"""
+_CSS_MIN = re.sub(r"/\*.*?\*/", "", _CSS, flags=re.S)
+_CSS_MIN = re.sub(r"\s+", " ", _CSS_MIN)
+_CSS_MIN = re.sub(r"\s*([{};:,>])\s*", r"\1", _CSS_MIN).strip()
+_CSS_MIN = f"<style>{_CSS_MIN}</style>"
+
+st.markdown(_CSS_MIN, unsafe_allow_html=True)
+
+# Shared Plotly theme and base layout - registered once, applied to every figure by
+# default, so chart builders only pass their own settings to update_layout
+pio.templates['port_dark'] = go.layout.Template(pio.templates['plotly_dark'])
+pio.templates['port_dark'].layout.update(
+    paper_bgcolor='rgba(26, 26, 40, 0.8)',
+    height=350,
+    showlegend=True
+)
+pio.templates.default = 'port_dark'
 
 
 # ============================================================================
@@ -115,6 +123,8 @@ def show_portfolio_overview():
     st.title("📊 Portfolio Overview")
 
     portfolio = st.session_state.portfolio
+    # Key first: it refreshes stale quotes, so the frame below is the snapshot it names
+    positions_key = portfolio.positions_key()
     positions_df = portfolio.get_positions_df()
 
     if positions_df.empty:
@@ -135,12 +145,8 @@ def show_portfolio_overview():
     winners = len(positions_df[positions_df['pnl'] > 0])
     col4.metric("Winners", f"{winners}/{summary['total_positions']}")
 
-    # Calculate beta
-    try:
-        analytics = portfolio.analyze_portfolio()
-        col5.metric("Portfolio β", f"{analytics.portfolio_beta:.2f}")
-    except:
-        col5.metric("Portfolio β", "Calculating...")
+    # Beta only - full analytics live on the Analytics page
+    col5.metric("Portfolio β", f"{portfolio.portfolio_beta(positions_df):.2f}")
 
     st.markdown("---")
 
@@ -155,13 +161,12 @@ def show_portfolio_overview():
         # Top holdings summary
         st.markdown("### 📈 Top 3 Holdings")
         top3 = positions_df.nlargest(3, 'market_value')
-        for _, row in top3.iterrows():
-            pct = (row['market_value'] / summary['total_value']) * 100
-            st.markdown(f"**{row['ticker']}** - {pct:.1f}%")
+        pcts = (top3['market_value'] / summary['total_value'] * 100).to_numpy()
+        st.markdown("\n\n".join(f"**{t}** - {p:.1f}%" for t, p in zip(top3['ticker'], pcts)))
 
     with col2:
         st.markdown("### 💼 Positions")
-        show_clickable_positions_table(positions_df)
+        show_clickable_positions_table(positions_df, positions_key)
 
 
 def create_portfolio_pie_chart(positions_df: pd.DataFrame):
@@ -171,7 +176,7 @@ def create_portfolio_pie_chart(positions_df: pd.DataFrame):
         values=positions_df['market_value'],
         hole=0.45,
         marker=dict(
-            colors=px.colors.qualitative.Bold,
+            colors=qualitative.Bold,
             line=dict(color='#0a0a0f', width=2)
         ),
         textposition='auto',
@@ -180,8 +185,6 @@ def create_portfolio_pie_chart(positions_df: pd.DataFrame):
     )])
 
     fig.update_layout(
-        template="plotly_dark",
-        paper_bgcolor='rgba(26, 26, 40, 0.8)',
         height=400,
         showlegend=False,
         margin=dict(l=20, r=20, t=20, b=20)
@@ -190,36 +193,41 @@ def create_portfolio_pie_chart(positions_df: pd.DataFrame):
     return fig
 
 
-def show_clickable_positions_table(positions_df: pd.DataFrame):
-    """Display positions with click-to-drill-down functionality"""
-    # Table header
-    cols = st.columns([2, 1, 1, 1, 1, 1, 1])
-    cols[0].markdown("**Ticker**")
-    cols[1].markdown("**Type**")
-    cols[2].markdown("**Qty**")
-    cols[3].markdown("**Entry**")
-    cols[4].markdown("**Current**")
-    cols[5].markdown("**P&L**")
-    cols[6].markdown("**Action**")
-
-    st.markdown("---")
-
-    # Each position row
-    for idx, row in positions_df.iterrows():
-        cols = st.columns([2, 1, 1, 1, 1, 1, 1])
-
-        cols[0].markdown(f"**{row['ticker']}**")
-        cols[1].write(row['type'])
-        cols[2].write(str(row['quantity']))
-        cols[3].write(f"${row['entry_price']:.2f}")
-        cols[4].write(f"${row['current_price']:.2f}")
-
-        pnl_color = "🟢" if row['pnl'] >= 0 else "🔴"
-        cols[5].markdown(f"{pnl_color} ${row['pnl']:,.0f}")
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _positions_arrow(key: tuple, _positions_df: pd.DataFrame) -> pa.Table:
+    """
+    Positions grid as an Arrow table, built once per positions/quotes snapshot.
+
+    st.dataframe takes the table as-is, so reruns skip the pandas -> Arrow
+    conversion. Arrow tables are immutable, so sharing one is safe.
+    """
+    # Currency columns stay float64 - float32's ~7 digits would drop cents on large positions
+    table = _positions_df[['ticker', 'type', 'quantity', 'entry_price', 'current_price', 'pnl']].copy()
+    table.insert(5, 'pnl_icon', np.where(_positions_df['pnl'] >= 0, '🟢', '🔴'))
+    return pa.Table.from_pandas(table, preserve_index=False)
+
+
+def show_clickable_positions_table(positions_df: pd.DataFrame, positions_key: tuple):
+    """Display positions with click-to-drill-down functionality (positions_key names positions_df's snapshot)"""
+    # Single grid widget - selecting a row drills down into that ticker
+    table = _positions_arrow(positions_key, positions_df)
+
+    event = st.dataframe(
+        table,
+        column_config={
+            'entry_price': st.column_config.NumberColumn(format='$%.2f'),
+            'current_price': st.column_config.NumberColumn(format='$%.2f'),
+            'pnl': st.column_config.NumberColumn(format='dollar')
+        },
+        use_container_width=True,
+        hide_index=True,
+        on_select='rerun',
+        selection_mode='single-row'
+    )
 
-        if cols[6].button("🔍", key=f"view_{row['ticker']}_{idx}"):
-            st.session_state.selected_ticker = row['ticker']
-            st.rerun()
+    if event.selection.rows:
+        st.session_state.selected_ticker = positions_df.iloc[event.selection.rows[0]]['ticker']
+        st.rerun()
 
 
 # ============================================================================
@@ -230,15 +238,32 @@ def show_manage_positions():
     """Dedicated page for adding/removing positions"""
     st.title("⚙️ Manage Portfolio Positions")
 
-    portfolio = st.session_state.portfolio
-
     tab1, tab2 = st.tabs(["➕ Add Position", "🗑️ Remove Positions"])
 
     with tab1:
-        st.markdown("### Add New Position")
+        show_add_position()
+
+    with tab2:
+        show_remove_positions()
+
 
-        position_type = st.selectbox("Type", ["Stock", "Call Option", "Put Option"])
+@st.fragment
+def show_add_position():
+    """
+    Add-position form.
 
+    As a fragment, changing the type or submitting a bad entry reruns only
+    this block; a successful add reruns the app so every page sees it.
+    """
+    portfolio = st.session_state.portfolio
+
+    st.markdown("### Add New Position")
+
+    # Type stays outside the form - it decides which fields the form shows
+    position_type = st.selectbox("Type", ["Stock", "Call Option", "Put Option"])
+
+    # Form batches the field edits into a single rerun on submit
+    with st.form("add_position_form"):
         col1, col2, col3 = st.columns(3)
 
         with col1:
@@ -258,64 +283,102 @@ def show_manage_positions():
             notes = st.text_area("Notes (optional)", height=100, key="add_notes")
 
         # Add button
-        if st.button("➕ Add Position", type="primary", use_container_width=True):
-            if not ticker:
-                st.error("Please enter a ticker symbol")
-            else:
-                try:
-                    if position_type == "Stock":
-                        portfolio.add_stock(ticker, quantity, entry_price, notes)
-                        st.success(f"✅ Added {quantity} shares of {ticker}")
-                    else:
-                        opt_type = 'call' if position_type == "Call Option" else 'put'
-                        exp_str = expiration.strftime('%Y-%m-%d')
-                        portfolio.add_option(ticker, opt_type, quantity, entry_price,
-                                            strike, exp_str, notes)
-                        st.success(f"✅ Added {quantity} {ticker} {opt_type}s")
-
-                    # Reload and redirect
-                    st.rerun()
+        submitted = st.form_submit_button("➕ Add Position", type="primary", use_container_width=True)
 
-                except Exception as e:
-                    st.error(f"Error adding position: {e}")
+    if submitted:
+        if not ticker:
+            st.error("Please enter a ticker symbol")
+        else:
+            try:
+                if position_type == "Stock":
+                    portfolio.add_stock(ticker, quantity, entry_price, notes)
+                    st.success(f"✅ Added {quantity} shares of {ticker}")
+                else:
+                    opt_type = 'call' if position_type == "Call Option" else 'put'
+                    exp_str = expiration.strftime('%Y-%m-%d')
+                    portfolio.add_option(ticker, opt_type, quantity, entry_price,
+                                        strike, exp_str, notes)
+                    st.success(f"✅ Added {quantity} {ticker} {opt_type}s")
 
-    with tab2:
-        st.markdown("### Current Positions")
-
-        positions_df = portfolio.get_positions_df()
-
-        if not positions_df.empty:
-            # Show positions with remove buttons
-            for idx, row in positions_df.iterrows():
-                with st.expander(f"{row['ticker']} - {row['type']} - ${row['market_value']:,.0f}"):
-                    col1, col2, col3 = st.columns([2, 2, 1])
-
-                    with col1:
-                        st.write(f"**Quantity:** {row['quantity']}")
-                        st.write(f"**Entry:** ${row['entry_price']:.2f}")
-                        st.write(f"**Current:** ${row['current_price']:.2f}")
-
-                    with col2:
-                        st.write(f"**Value:** ${row['market_value']:,.0f}")
-                        pnl_emoji = "🟢" if row['pnl'] >= 0 else "🔴"
-                        st.write(f"**P&L:** {pnl_emoji} ${row['pnl']:,.0f} ({row['pnl_pct']:+.1f}%)")
-
-                    with col3:
-                        if st.button("Remove", key=f"remove_{idx}", type="secondary"):
-                            portfolio.remove_position(idx)
-                            st.success(f"Removed {row['ticker']}")
-                            st.rerun()
-
-            # Clear all button
-            st.markdown("---")
-            if st.button("🗑️ Clear All Positions", type="secondary"):
-                confirm = st.checkbox("⚠️ Confirm clear all")
-                if confirm:
-                    portfolio.clear()
-                    st.success("All positions cleared")
-                    st.rerun()
+                # Reload and redirect
+                st.rerun(scope="app")
+
+            except Exception as e:
+                st.error(f"Error adding position: {e}")
+
+
+@st.fragment
+def show_remove_positions():
+    """
+    Positions grid with a details/remove panel for the selected row.
+
+    Selecting rows reruns only this fragment; removing positions reruns the
+    app so the cached analytics are rebuilt.
+    """
+    portfolio = st.session_state.portfolio
+
+    st.markdown("### Current Positions")
+
+    positions_df = portfolio.get_positions_df()
+
+    if not positions_df.empty:
+        # One selectable grid plus a single details panel (not one expander per position)
+        table = positions_df[['ticker', 'type', 'quantity', 'entry_price', 'current_price',
+                              'market_value', 'pnl', 'pnl_pct']]
+
+        event = st.dataframe(
+            table,
+            column_config={
+                'entry_price': st.column_config.NumberColumn(format='$%.2f'),
+                'current_price': st.column_config.NumberColumn(format='$%.2f'),
+                'market_value': st.column_config.NumberColumn(format='dollar'),
+                'pnl': st.column_config.NumberColumn(format='dollar'),
+                'pnl_pct': st.column_config.NumberColumn(format='%+.1f%%')
+            },
+            use_container_width=True,
+            hide_index=True,
+            on_select='rerun',
+            selection_mode='single-row',
+            key='remove_table'
+        )
+
+        selected = [r for r in event.selection.rows if r < len(positions_df)]
+
+        if selected:
+            row = positions_df.iloc[selected[0]]
+            idx, ticker = int(row['index']), row['ticker']
+
+            with st.expander(f"{ticker} - {row['type']} - ${row['market_value']:,.0f}", expanded=True):
+                col1, col2, col3 = st.columns([2, 2, 1])
+
+                with col1:
+                    st.write(f"**Quantity:** {row['quantity']}")
+                    st.write(f"**Entry:** ${row['entry_price']:.2f}")
+                    st.write(f"**Current:** ${row['current_price']:.2f}")
+
+                with col2:
+                    st.write(f"**Value:** ${row['market_value']:,.0f}")
+                    pnl_emoji = "🟢" if row['pnl'] >= 0 else "🔴"
+                    st.write(f"**P&L:** {pnl_emoji} ${row['pnl']:,.0f} ({row['pnl_pct']:+.1f}%)")
+
+                with col3:
+                    if st.button("Remove", key=f"remove_{idx}", type="secondary"):
+                        portfolio.remove_position(idx)
+                        st.success(f"Removed {ticker}")
+                        st.rerun(scope="app")
         else:
-            st.info("No positions to remove")
+            st.caption("Select a position to view details or remove it")
+
+        # Clear all button
+        st.markdown("---")
+        if st.button("🗑️ Clear All Positions", type="secondary"):
+            confirm = st.checkbox("⚠️ Confirm clear all")
+            if confirm:
+                portfolio.clear()
+                st.success("All positions cleared")
+                st.rerun(scope="app")
+    else:
+        st.info("No positions to remove")
 
 
 # ============================================================================
@@ -369,43 +432,40 @@ def show_stock_detail(ticker: str):
     # 2×3 Grid
     st.markdown("### 📊 Analytics (Click any chart to expand)")
 
+    # Fetch all panels concurrently; each result() is awaited where it is rendered
+    charts = submit_chart_builders({
+        'price': (cached_chart, create_price_chart_with_entry, ticker, round(position['entry_price'], 2)),
+        'beta': (cached_chart, create_stock_beta_chart, ticker),
+        'correlation': (cached_chart, create_correlation_bars, ticker, tuple(portfolio.get_unique_tickers())),
+        'distribution': (cached_chart, create_distribution_chart, ticker),
+        'iv_percentile': (create_iv_percentile_chart, ticker)
+    })
+
     # ROW 1
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("#### 📈 Price History")
-        fig = create_price_chart_with_entry(ticker, position['entry_price'])
-        st.plotly_chart(fig, use_container_width=True)
-        if st.button("🔍 Expand", key="expand_price"):
-            st.session_state.expanded_chart = 'price'
-            st.rerun()
+        fig = charts['price'].result()
+        show_expandable_chart(fig, 'price')
 
     with col2:
         st.markdown("#### 📊 Rolling Beta")
-        fig = create_stock_beta_chart(ticker)
-        st.plotly_chart(fig, use_container_width=True)
-        if st.button("🔍 Expand", key="expand_beta"):
-            st.session_state.expanded_chart = 'beta'
-            st.rerun()
+        fig = charts['beta'].result()
+        show_expandable_chart(fig, 'beta')
 
     # ROW 2
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("#### 🔗 Portfolio Correlation")
-        fig = create_correlation_bars(ticker, portfolio)
-        st.plotly_chart(fig, use_container_width=True)
-        if st.button("🔍 Expand", key="expand_corr"):
-            st.session_state.expanded_chart = 'correlation'
-            st.rerun()
+        fig = charts['correlation'].result()
+        show_expandable_chart(fig, 'correlation')
 
     with col2:
         st.markdown("#### 📉 Implied Distribution")
-        fig = create_distribution_chart(ticker)
-        st.plotly_chart(fig, use_container_width=True)
-        if st.button("🔍 Expand", key="expand_dist"):
-            st.session_state.expanded_chart = 'distribution'
-            st.rerun()
+        fig = charts['distribution'].result()
+        show_expandable_chart(fig, 'distribution')
 
     # ROW 3
     col1, col2 = st.columns(2)
@@ -416,26 +476,40 @@ def show_stock_detail(ticker: str):
 
     with col2:
         st.markdown("#### 📊 IV Percentile")
-        fig = create_iv_percentile_chart(ticker)
+        fig = charts['iv_percentile'].result()
         st.plotly_chart(fig, use_container_width=True)
+        # Gauge indicator has no selectable points, so it keeps an explicit button
         if st.button("🔍 Expand", key="expand_iv"):
             st.session_state.expanded_chart = 'iv_percentile'
             st.rerun()
 
-    # Bottom tabs
+    # Bottom panels
     st.markdown("---")
-    tab1, tab2, tab3, tab4 = st.tabs(["📊 Fundamentals", "🏢 Sector Comparison", "📈 Volume Analysis", "📰 News (Future)"])
+    show_detail_sections(ticker)
 
-    with tab1:
+
+@st.fragment
+def show_detail_sections(ticker: str):
+    """
+    Fundamentals / sector / volume / news panels below the chart grid.
+
+    st.tabs runs every tab body on each rerun, so a horizontal radio selects
+    the one section to build. As a fragment, switching sections reruns only
+    this block - the chart grid above is not re-executed.
+    """
+    section = st.radio("Section", ["📊 Fundamentals", "🏢 Sector Comparison", "📈 Volume Analysis", "📰 News (Future)"],
+                       horizontal=True, key="detail_section", label_visibility="collapsed")
+
+    if section == "📊 Fundamentals":
         show_fundamentals(ticker)
 
-    with tab2:
+    elif section == "🏢 Sector Comparison":
         show_sector_comparison(ticker)
 
-    with tab3:
+    elif section == "📈 Volume Analysis":
         show_volume_analysis(ticker)
 
-    with tab4:
+    else:
         st.info("📰 News integration coming soon")
         st.markdown("**Placeholder for:** Latest news, earnings, SEC filings")
 
@@ -445,23 +519,25 @@ def show_expanded_chart(ticker: str, chart_type: str, position):
     st.markdown(f"### {ticker} - {chart_type.replace('_', ' ').title()}")
 
     if chart_type == 'price':
-        fig = create_price_chart_detailed(ticker, position['entry_price'])
+        fig = cached_chart(create_price_chart_with_entry, ticker, round(position['entry_price'], 2))
         st.plotly_chart(fig, use_container_width=True)
 
     elif chart_type == 'beta':
-        fig = create_beta_chart_detailed(ticker)
+        fig = cached_chart(create_beta_chart_detailed, ticker)
         st.plotly_chart(fig, use_container_width=True)
 
     elif chart_type == 'correlation':
-        fig = create_correlation_detailed(ticker)
+        fig = cached_chart(create_correlation_bars, ticker,
+                           tuple(st.session_state.portfolio.get_unique_tickers()))
         st.plotly_chart(fig, use_container_width=True)
 
     elif chart_type == 'distribution':
-        fig = create_distribution_detailed(ticker)
+        fig = cached_chart(create_distribution_chart, ticker)
+        fig.update_layout(height=600)
         st.plotly_chart(fig, use_container_width=True)
 
     elif chart_type == 'iv_percentile':
-        fig = create_iv_detailed(ticker)
+        fig = create_iv_percentile_chart(ticker)
         st.plotly_chart(fig, use_container_width=True)
 
 
@@ -469,14 +545,201 @@ def show_expanded_chart(ticker: str, chart_type: str, position):
 # CHART HELPER FUNCTIONS
 # ============================================================================
 
+def show_expandable_chart(fig: go.Figure, name: str):
+    """
+    Render a chart that opens its expanded view when a point is clicked or selected.
+
+    The chart itself is the interactive element - no separate Expand button.
+    """
+    event = st.plotly_chart(fig, use_container_width=True, key=f"chart_{name}",
+                            on_select='rerun', selection_mode=('points', 'box'))
+
+    if event.selection.points or event.selection.box:
+        st.session_state.expanded_chart = name
+        st.rerun()
+
+
+def submit_chart_builders(builders: Dict[str, tuple]) -> Dict[str, Future]:
+    """
+    Run independent chart builders in a thread pool.
+
+    builders maps name -> (function, *args). The builders are I/O bound
+    (yfinance) so they overlap; Streamlit rendering stays on the main thread.
+    Worker threads get the script context so st.session_state/st.cache_data work.
+    """
+    ctx = get_script_run_ctx()
+
+    def attach_ctx():
+        add_script_run_ctx(threading.current_thread(), ctx)
+
+    pool = ThreadPoolExecutor(max_workers=len(builders), initializer=attach_ctx)
+    futures = {name: pool.submit(fn, *args) for name, (fn, *args) in builders.items()}
+    pool.shutdown(wait=False)  # Workers finish the queued builders, caller awaits futures
+    return futures
+
+
+class ChartUnavailable(Exception):
+    """Raised by a cached chart builder instead of returning a placeholder figure (message is shown)"""
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _chart_json(builder, *args) -> str:
+    """Serialized figure for builder(*args), so reruns skip both the build and the JSON encode"""
+    return builder(*args).to_json()
+
+
+def cached_chart(builder, *args) -> go.Figure:
+    """
+    Figure rehydrated from the cached JSON of builder(*args).
+
+    Builders raise ChartUnavailable rather than returning a placeholder, so
+    failures (e.g. a yfinance timeout) are never cached and the next rerun
+    retries; the placeholder is built here instead.
+    """
+    try:
+        return pio.from_json(_chart_json(builder, *args))
+    except ChartUnavailable as e:
+        return create_empty_chart(str(e))
+
+
+# Lookbacks served from the cached 2y history
+_PERIOD_OFFSETS = {
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '2y': pd.DateOffset(years=2)
+}
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _hist_base(ticker: str) -> pd.DataFrame:
+    """Full 2y price history, downloaded once a day per ticker"""
+    hist = yf.Ticker(ticker).history(period='2y')
+    # history() returns an empty frame on failure - raise so it isn't cached for a day
+    if hist.empty:
+        raise ValueError(f"No historical data available for {ticker}")
+    return hist
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _hist_2y(ticker: str) -> pd.DataFrame:
+    """
+    2y history kept current by fetching only the tail since the cached base.
+
+    The one download per ticker behind every lookback; a refresh pulls a few
+    rows instead of re-downloading two years.
+
+    The tail overlaps the base by one completed bar. Prices are auto-adjusted,
+    so a split or dividend since the base was cached changes that bar's close;
+    the base is then refetched rather than spliced into a discontinuity.
+    """
+    base = _hist_base(ticker)
+    anchor = base.index[-2] if len(base) > 1 else base.index[-1]
+    tail = yf.Ticker(ticker).history(start=anchor.strftime('%Y-%m-%d'))
+    if tail.empty:
+        return base
+    if anchor in tail.index and not np.isclose(tail.at[anchor, 'Close'], base.at[anchor, 'Close'], rtol=1e-4):
+        _hist_base.clear(ticker)
+        return _hist_base(ticker)
+    # The tail restates the cached bars it overlaps, so it replaces rather than duplicates them
+    return pd.concat([base[base.index < tail.index[0]], tail])
+
+
+def _get_history(ticker: str, period: str) -> pd.DataFrame:
+    """Trailing period slice of the cached 2y history (no extra download per lookback)"""
+    hist = _hist_2y(ticker)
+    if hist.empty:
+        return hist
+    return hist[hist.index >= hist.index[-1] - _PERIOD_OFFSETS[period]]
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _download_prices(tickers: tuple, period: str = '1y') -> pd.DataFrame:
+    """Close prices for all tickers from a single multi-symbol yf.download call"""
+    data = yf.download(list(tickers), period=period, threads=True,
+                       progress=False, auto_adjust=True)
+    return data['Close'].ffill(limit=5)
+
+
+# Ticker.info fields read by the ratings, fundamentals and sector panels
+_INFO_KEYS = (
+    'recommendationKey', 'targetMeanPrice', 'numberOfAnalystOpinions',
+    'currentPrice', 'regularMarketPrice', 'marketCap', 'trailingPE',
+    'dividendYield', 'beta', 'sector', 'industry',
+    'fiftyTwoWeekHigh', 'fiftyTwoWeekLow'
+)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _get_info(ticker: str) -> dict:
+    """The _INFO_KEYS subset of Ticker.info, shared across panels and sessions"""
+    info = yf.Ticker(ticker).info
+    return {key: info[key] for key in _INFO_KEYS if key in info}
+
+
+def _downsample_ohlc(hist: pd.DataFrame, max_points: int = 200) -> pd.DataFrame:
+    """
+    Weekly OHLCV bars when a daily series is denser than the chart can show.
+
+    Extra indicator columns (e.g. moving averages) keep their last daily value.
+    """
+    if len(hist) <= max_points:
+        return hist
+
+    agg = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+    agg.update({col: 'last' for col in hist.columns if col not in agg})
+
+    return hist.resample('W').agg(agg).dropna(subset=['Close'])
+
+
+def _minmax_idx(y, max_points: int = 200) -> np.ndarray:
+    """
+    Sample indices keeping each bucket's min and max, so at most ~max_points reach the browser.
+
+    Unlike a fixed stride, spikes survive downsampling - the line keeps its
+    visual envelope at any length. First and last samples are always kept.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+
+    buckets = max(1, max_points // 2)
+    width = -(-n // buckets)
+    padded = np.full(buckets * width, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, width)
+
+    offsets = np.arange(buckets) * width
+    lo = np.where(np.isnan(padded), np.inf, padded).argmin(axis=1) + offsets
+    hi = np.where(np.isnan(padded), -np.inf, padded).argmax(axis=1) + offsets
+
+    idx = np.unique(np.concatenate(([0, n - 1], lo, hi)))
+    return idx[idx < n]
+
+
+def _f32(a):
+    """Contiguous float32 copy of an array for Plotly (display only - math stays float64)"""
+    return np.ascontiguousarray(a, dtype=np.float32)
+
+
 def create_price_chart_with_entry(ticker: str, entry_price: float):
     """Candlestick chart with entry price marked"""
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period='1y')
+        hist = _get_history(ticker, '1y')
 
         if hist.empty:
-            return create_empty_chart("No price data available")
+            raise ChartUnavailable("No price data available")
+
+        # MA50 needs 50 closes; a short frame would only build all-NaN traces
+        if len(hist) < 50:
+            raise ChartUnavailable("Insufficient history")
+
+        # Indicators use the daily closes; only the display copy is thinned
+        ma20, ma50 = dual_rolling_mean(hist['Close'].to_numpy(), 20, 50)
+        bars = _downsample_ohlc(
+            hist[['Open', 'High', 'Low', 'Close', 'Volume']].assign(MA20=ma20, MA50=ma50)
+        )
 
         fig = make_subplots(
             rows=2, cols=1,
@@ -487,11 +750,11 @@ def create_price_chart_with_entry(ticker: str, entry_price: float):
 
         # Candlestick
         fig.add_trace(go.Candlestick(
-            x=hist.index,
-            open=hist['Open'],
-            high=hist['High'],
-            low=hist['Low'],
-            close=hist['Close'],
+            x=bars.index,
+            open=bars['Open'],
+            high=bars['High'],
+            low=bars['Low'],
+            close=bars['Close'],
             name='Price'
         ), row=1, col=1)
 
@@ -506,34 +769,28 @@ def create_price_chart_with_entry(ticker: str, entry_price: float):
         )
 
         # Moving averages
-        hist['MA20'] = hist['Close'].rolling(20).mean()
-        hist['MA50'] = hist['Close'].rolling(50).mean()
-
         fig.add_trace(go.Scatter(
-            x=hist.index, y=hist['MA20'],
+            x=bars.index, y=_f32(bars['MA20']),
             name='MA20', line=dict(color='orange', width=1)
         ), row=1, col=1)
 
         fig.add_trace(go.Scatter(
-            x=hist.index, y=hist['MA50'],
+            x=bars.index, y=_f32(bars['MA50']),
             name='MA50', line=dict(color='purple', width=1)
         ), row=1, col=1)
 
         # Volume
-        colors = ['#10b981' if hist['Close'].iloc[i] >= hist['Open'].iloc[i]
-                  else '#ef4444' for i in range(len(hist))]
+        close = bars['Close'].to_numpy()
+        open_ = bars['Open'].to_numpy()
+        colors = np.where(close >= open_, '#10b981', '#ef4444').tolist()
 
         fig.add_trace(go.Bar(
-            x=hist.index, y=hist['Volume'],
+            x=bars.index, y=bars['Volume'],
             name='Volume', marker_color=colors, opacity=0.5
         ), row=2, col=1)
 
         fig.update_layout(
-            template="plotly_dark",
-            paper_bgcolor='rgba(26, 26, 40, 0.8)',
-            height=350,
             xaxis_rangeslider_visible=False,
-            showlegend=True,
             legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
         )
 
@@ -543,27 +800,34 @@ def create_price_chart_with_entry(ticker: str, entry_price: float):
 
         return fig
 
+    except ChartUnavailable:
+        raise
     except Exception as e:
-        return create_empty_chart(f"Error loading price data: {e}")
+        raise ChartUnavailable(f"Error loading price data: {e}") from e
 
 
-def create_price_chart_detailed(ticker: str, entry_price: float):
-    """Detailed full-screen price chart"""
-    return create_price_chart_with_entry(ticker, entry_price)
+@st.cache_data(ttl=300, show_spinner=False)
+def _beta_data(ticker: str):
+    """1y rolling beta vs SPY, shared by the summary and detailed beta charts"""
+    prices = pd.DataFrame({
+        ticker: _get_history(ticker, '1y')['Close'],
+        'SPY': _get_history('SPY', '1y')['Close']
+    })
+    return st.session_state.corr_analyzer.rolling_beta(ticker, 'SPY', prices=prices)
 
 
 def create_stock_beta_chart(ticker: str):
     """Create rolling beta chart for single stock"""
     try:
-        corr_analyzer = st.session_state.corr_analyzer
-        beta_result = corr_analyzer.rolling_beta(ticker, 'SPY', period='1y', window=60)
+        beta_result = _beta_data(ticker)
 
         fig = go.Figure()
 
         # Beta line
+        idx = _minmax_idx(beta_result.betas)
         fig.add_trace(go.Scatter(
-            x=beta_result.rolling_beta.index,
-            y=beta_result.rolling_beta,
+            x=beta_result.dates[idx],
+            y=_f32(beta_result.betas[idx]),
             name='Rolling Beta',
             line=dict(color='#6366f1', width=2)
         ))
@@ -580,208 +844,217 @@ def create_stock_beta_chart(ticker: str):
         fig.add_hline(y=1.0, line_dash="dot", line_color="gray", opacity=0.5)
 
         fig.update_layout(
-            template="plotly_dark",
-            paper_bgcolor='rgba(26, 26, 40, 0.8)',
-            height=350,
             yaxis_title="Beta vs SPY",
-            xaxis_title="Date",
-            showlegend=True
+            xaxis_title="Date"
         )
 
         return fig
 
+    except ChartUnavailable:
+        raise
     except Exception as e:
-        return create_empty_chart(f"Beta calculation unavailable: {e}")
+        raise ChartUnavailable(f"Beta calculation unavailable: {e}") from e
 
 
 def create_beta_chart_detailed(ticker: str):
     """Detailed beta chart with more metrics"""
     try:
-        corr_analyzer = st.session_state.corr_analyzer
-        beta_result = corr_analyzer.rolling_beta(ticker, 'SPY', period='1y', window=60)
+        beta_result = _beta_data(ticker)
 
-        fig = make_subplots(
-            rows=2, cols=1,
-            row_heights=[0.7, 0.3],
-            subplot_titles=['Rolling Beta', 'R² (Correlation Quality)']
-        )
+        # One plot area with overlaid y-axes instead of stacked subplots
+        fig = go.Figure()
 
         # Beta
-        fig.add_trace(go.Scatter(
-            x=beta_result.rolling_beta.index,
-            y=beta_result.rolling_beta,
+        fig.add_trace(go.Scattergl(
+            x=beta_result.dates,
+            y=_f32(beta_result.betas),
             name='Beta',
             line=dict(color='#6366f1', width=2)
-        ), row=1, col=1)
+        ))
 
-        fig.add_hline(y=1.0, line_dash="dot", line_color="gray", row=1, col=1)
+        fig.add_hline(y=1.0, line_dash="dot", line_color="gray")
+
+        # Alpha (annualized %)
+        fig.add_trace(go.Scattergl(
+            x=beta_result.dates,
+            y=_f32(beta_result.alphas * 252 * 100),
+            name='Alpha (%)',
+            line=dict(color='#10b981', width=1),
+            yaxis='y2'
+        ))
 
         # R²
-        fig.add_trace(go.Scatter(
-            x=beta_result.rolling_beta.index,
-            y=beta_result.r_squared,
+        fig.add_trace(go.Scattergl(
+            x=beta_result.dates,
+            y=_f32(beta_result.r_squared),
             name='R²',
             line=dict(color='#f59e0b', width=2),
-            fill='tozeroy'
-        ), row=2, col=1)
+            yaxis='y3'
+        ))
+
+        fig.add_shape(type='line', xref='x domain', x0=0, x1=1, yref='y3', y0=0.5, y1=0.5,
+                      line=dict(color='gray', dash='dot', width=1))
 
         fig.update_layout(
-            template="plotly_dark",
             height=600,
-            showlegend=True
+            xaxis=dict(domain=[0, 0.88]),
+            yaxis=dict(title='Beta vs SPY'),
+            yaxis2=dict(title='Alpha (%)', overlaying='y', side='right'),
+            yaxis3=dict(title='R²', overlaying='y', side='right', anchor='free',
+                        position=0.97, range=[0, 1])
         )
 
         return fig
 
+    except ChartUnavailable:
+        raise
     except Exception as e:
-        return create_empty_chart(f"Error: {e}")
+        raise ChartUnavailable(f"Error: {e}") from e
 
 
-def create_correlation_bars(ticker: str, portfolio: CentralPortfolio):
+def create_correlation_bars(ticker: str, tickers: tuple):
     """Create bar chart of correlations with other portfolio positions"""
     try:
         corr_analyzer = st.session_state.corr_analyzer
-        tickers = portfolio.get_unique_tickers()
         other_tickers = [t for t in tickers if t != ticker]
 
         if not other_tickers:
-            return create_empty_chart("No other positions to correlate")
+            raise ChartUnavailable("No other positions to correlate")
 
-        correlations = []
-        for other in other_tickers:
-            try:
-                rolling_corr = corr_analyzer.rolling_correlation(ticker, other, period='1y')
-                if not rolling_corr.empty:
-                    current_corr = rolling_corr.iloc[-1]
-                    correlations.append({'ticker': other, 'correlation': current_corr})
-            except:
-                pass
+        # All pairs in one rolling pass over the returns matrix the analytics page also uses
+        returns = _returns_matrix(tickers)
+        rolling_corr = returns[other_tickers].rolling(
+            window=corr_analyzer.window,
+            min_periods=corr_analyzer.min_periods
+        ).corr(returns[ticker])
+        current = rolling_corr.ffill().iloc[-1].dropna()
 
-        if not correlations:
-            return create_empty_chart("Unable to calculate correlations")
+        if current.empty:
+            raise ChartUnavailable("Unable to calculate correlations")
 
-        corr_df = pd.DataFrame(correlations)
+        names = current.index.to_numpy()
+        values = _f32(current.to_numpy())
 
         # Bar chart
         fig = go.Figure(data=[go.Bar(
-            x=corr_df['ticker'],
-            y=corr_df['correlation'],
-            marker_color=['#10b981' if c >= 0 else '#ef4444' for c in corr_df['correlation']]
+            x=names,
+            y=values,
+            marker_color=np.where(values >= 0, '#10b981', '#ef4444').tolist()
         )])
 
         fig.add_hline(y=0, line_dash="dash", line_color="gray")
         fig.update_layout(
-            template="plotly_dark",
-            paper_bgcolor='rgba(26, 26, 40, 0.8)',
-            height=350,
             yaxis_range=[-1, 1],
             yaxis_title="Correlation",
-            xaxis_title="Ticker"
+            xaxis_title="Ticker",
+            showlegend=False
         )
 
         return fig
 
+    except ChartUnavailable:
+        raise
     except Exception as e:
-        return create_empty_chart(f"Error: {e}")
+        raise ChartUnavailable(f"Error: {e}") from e
 
 
-def create_correlation_detailed(ticker: str):
-    """Detailed correlation analysis"""
-    return create_correlation_bars(ticker, st.session_state.portfolio)
+@st.cache_data(ttl=900, show_spinner=False)
+def _fit_distribution(ticker: str, expiration_index: int = 0):
+    """Fitted (strikes, density, current_price) for one expiration, cached per (ticker, expiry)"""
+    dist = DistributionForecaster().fit(ticker, expiration_index)
+    # fit() returns None on a failed chain fetch - raise so the failure isn't cached
+    if dist is None:
+        raise ChartUnavailable("No options data available")
+    # Stored as float32 - the chart consumes them directly and the cache entry is half the size
+    return _f32(dist.strikes), _f32(dist.density), float(dist.current_price)
 
 
 def create_distribution_chart(ticker: str):
     """Create implied distribution chart from options"""
     try:
-        analyzer = st.session_state.options_analyzer
-        results = analyzer.analyze_ticker(ticker, 0)
-
-        if results['implied_distribution'] is None:
-            return create_empty_chart("No options data available")
-
-        dist = results['implied_distribution']
+        strikes, density, current_price = _fit_distribution(ticker, 0)
 
         fig = go.Figure()
 
         # Distribution curve
         fig.add_trace(go.Scatter(
-            x=dist.strikes,
-            y=dist.probabilities,
+            x=strikes,
+            y=density,
             name='Implied Distribution',
             line=dict(color='#6366f1', width=2),
-            fill='tozeroy'
+            fill='tozeroy',
+            hovertemplate='$%{x:.2f}<br>Density: %{y:.4f}<extra></extra>'
         ))
 
         # Current price
         fig.add_vline(
-            x=dist.current_price,
+            x=current_price,
             line_dash="dash",
             line_color="#10b981",
             annotation_text="Current"
         )
 
         fig.update_layout(
-            template="plotly_dark",
-            paper_bgcolor='rgba(26, 26, 40, 0.8)',
-            height=350,
             xaxis_title="Price ($)",
             yaxis_title="Probability Density",
-            showlegend=True
+            uirevision=ticker
         )
 
         return fig
 
+    except ChartUnavailable:
+        raise
     except Exception as e:
-        return create_empty_chart(f"Distribution unavailable: {e}")
+        raise ChartUnavailable(f"Distribution unavailable: {e}") from e
 
 
-def create_distribution_detailed(ticker: str):
-    """Detailed distribution with more metrics"""
-    return create_distribution_chart(ticker)
+@st.cache_data(ttl=900, show_spinner=False)
+def _atm_iv(ticker: str, expiration_index: int = 0):
+    """ATM implied vol for one expiration, cached so reruns skip the full chain analysis"""
+    results = st.session_state.options_analyzer.analyze_ticker(ticker, expiration_index)
+    dist = results['implied_distribution']
+    # Raise rather than return a sentinel, so a failed lookup isn't cached
+    if dist is None:
+        raise ValueError(f"No implied distribution for {ticker}")
+    return float(dist.atm_iv)
 
 
 def create_iv_percentile_chart(ticker: str):
     """Show current IV vs historical percentiles"""
     try:
-        analyzer = st.session_state.options_analyzer
-        results = analyzer.analyze_ticker(ticker, 0)
-
-        if results['implied_distribution']:
-            current_iv = results['implied_distribution'].atm_iv
-
-            fig = go.Figure()
-
-            # Gauge chart
-            fig.add_trace(go.Indicator(
-                mode="gauge+number+delta",
-                value=current_iv * 100,
-                title={'text': "ATM IV (%)"},
-                delta={'reference': 20, 'suffix': ""},
-                gauge={
-                    'axis': {'range': [0, 100]},
-                    'bar': {'color': "#6366f1"},
-                    'steps': [
-                        {'range': [0, 20], 'color': "#10b981"},
-                        {'range': [20, 40], 'color': "#3b82f6"},
-                        {'range': [40, 60], 'color': "#f59e0b"},
-                        {'range': [60, 100], 'color': "#ef4444"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "white", 'width': 2},
-                        'thickness': 0.75,
-                        'value': current_iv * 100
-                    }
+        current_iv = _atm_iv(ticker, 0)
+
+        fig = go.Figure()
+
+        # Gauge chart
+        fig.add_trace(go.Indicator(
+            mode="gauge+number+delta",
+            value=current_iv * 100,
+            title={'text': "ATM IV (%)"},
+            delta={'reference': 20, 'suffix': ""},
+            gauge={
+                'axis': {'range': [0, 100]},
+                'bar': {'color': "#6366f1"},
+                'steps': [
+                    {'range': [0, 20], 'color': "#10b981"},
+                    {'range': [20, 40], 'color': "#3b82f6"},
+                    {'range': [40, 60], 'color': "#f59e0b"},
+                    {'range': [60, 100], 'color': "#ef4444"}
+                ],
+                'threshold': {
+                    'line': {'color': "white", 'width': 2},
+                    'thickness': 0.75,
+                    'value': current_iv * 100
                 }
-            ))
+            }
+        ))
 
-            fig.update_layout(
-                template="plotly_dark",
-                paper_bgcolor='rgba(26, 26, 40, 0.8)',
-                height=350,
-                margin=dict(l=20, r=20, t=50, b=20)
-            )
+        fig.update_layout(
+            margin=dict(l=20, r=20, t=50, b=20),
+            showlegend=False
+        )
 
-            return fig
+        return fig
 
     except:
         pass
@@ -789,16 +1062,10 @@ def create_iv_percentile_chart(ticker: str):
     return create_empty_chart("No options data available")
 
 
-def create_iv_detailed(ticker: str):
-    """Detailed IV analysis"""
-    return create_iv_percentile_chart(ticker)
-
-
 def show_analyst_ratings_panel(ticker: str):
     """Display analyst ratings and recommendations"""
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = _get_info(ticker)
 
         # Key metrics
         col1, col2, col3 = st.columns(3)
@@ -840,8 +1107,7 @@ def show_analyst_ratings_panel(ticker: str):
 def show_fundamentals(ticker: str):
     """Show key fundamental metrics"""
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = _get_info(ticker)
 
         col1, col2, col3, col4 = st.columns(4)
 
@@ -878,22 +1144,25 @@ def show_fundamentals(ticker: str):
 def show_volume_analysis(ticker: str):
     """Analyze recent volume patterns"""
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period='3mo')
+        hist = _get_history(ticker, '3mo')
 
         if hist.empty:
             st.warning("No volume data available")
             return
 
+        if len(hist) < 20:
+            st.warning("Insufficient volume history for a 20-day average")
+            return
+
         # Calculate average volume
-        avg_volume = hist['Volume'].rolling(20).mean()
+        avg_volume = rolling_mean(hist['Volume'].to_numpy(float), 20)
         recent_volume = hist['Volume'].iloc[-1]
-        volume_ratio = recent_volume / avg_volume.iloc[-1] if len(avg_volume) > 0 and avg_volume.iloc[-1] > 0 else 1
+        volume_ratio = recent_volume / avg_volume[-1] if len(avg_volume) > 0 and avg_volume[-1] > 0 else 1
 
         col1, col2, col3 = st.columns(3)
 
         col1.metric("Recent Volume", f"{recent_volume/1e6:.1f}M")
-        col2.metric("20D Avg", f"{avg_volume.iloc[-1]/1e6:.1f}M")
+        col2.metric("20D Avg", f"{avg_volume[-1]/1e6:.1f}M")
         col3.metric("Ratio", f"{volume_ratio:.2f}x")
 
         if volume_ratio > 2:
@@ -915,16 +1184,14 @@ def show_volume_analysis(ticker: str):
 
         fig.add_trace(go.Scatter(
             x=hist.index,
-            y=avg_volume,
+            y=_f32(avg_volume),
             name='20D Average',
             line=dict(color='#f59e0b', width=2)
         ))
 
         fig.update_layout(
-            template="plotly_dark",
             height=300,
-            yaxis_title="Volume",
-            showlegend=True
+            yaxis_title="Volume"
         )
 
         st.plotly_chart(fig, use_container_width=True)
@@ -936,8 +1203,7 @@ def show_volume_analysis(ticker: str):
 def show_sector_comparison(ticker: str):
     """Compare performance vs sector ETF"""
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = _get_info(ticker)
         sector = info.get('sector', None)
 
         # Map sectors to ETFs
@@ -960,16 +1226,21 @@ def show_sector_comparison(ticker: str):
         st.write(f"**Sector:** {sector} (ETF: {sector_etf})")
 
         # Fetch performance data
-        stock_hist = stock.history(period='1y')
-        sector_hist = yf.Ticker(sector_etf).history(period='1y')
+        stock_hist = _get_history(ticker, '1y')
+        sector_hist = _get_history(sector_etf, '1y')
 
-        if stock_hist.empty or sector_hist.empty:
+        if len(stock_hist) < 2 or len(sector_hist) < 2:
             st.warning("Unable to fetch comparison data")
             return
 
-        # Calculate returns
-        stock_return = ((stock_hist['Close'].iloc[-1] / stock_hist['Close'].iloc[0]) - 1) * 100
-        sector_return = ((sector_hist['Close'].iloc[-1] / sector_hist['Close'].iloc[0]) - 1) * 100
+        # Normalize to 100 in one scaled divide; the period return is the last point
+        stock_close = stock_hist['Close'].to_numpy()
+        sector_close = sector_hist['Close'].to_numpy()
+        stock_norm = stock_close * (100.0 / stock_close[0])
+        sector_norm = sector_close * (100.0 / sector_close[0])
+
+        stock_return = stock_norm[-1] - 100.0
+        sector_return = sector_norm[-1] - 100.0
 
         relative_strength = stock_return - sector_return
 
@@ -979,27 +1250,22 @@ def show_sector_comparison(ticker: str):
         col3.metric("Relative Strength", f"{relative_strength:+.1f}%",
                     delta="Outperforming" if relative_strength > 5 else ("Underperforming" if relative_strength < -5 else None))
 
-        # Comparison chart - normalize to 100
-        stock_norm = (stock_hist['Close'] / stock_hist['Close'].iloc[0]) * 100
-        sector_norm = (sector_hist['Close'] / sector_hist['Close'].iloc[0]) * 100
-
+        # Comparison chart
         fig = go.Figure()
 
         fig.add_trace(go.Scatter(
-            x=stock_hist.index, y=stock_norm,
+            x=stock_hist.index, y=_f32(stock_norm),
             name=ticker, line=dict(color='#6366f1', width=2)
         ))
 
         fig.add_trace(go.Scatter(
-            x=sector_hist.index, y=sector_norm,
+            x=sector_hist.index, y=_f32(sector_norm),
             name=sector_etf, line=dict(color='#f59e0b', width=2)
         ))
 
         fig.update_layout(
-            template="plotly_dark",
             height=300,
-            yaxis_title="Normalized Performance (Base=100)",
-            showlegend=True
+            yaxis_title="Normalized Performance (Base=100)"
         )
 
         st.plotly_chart(fig, use_container_width=True)
@@ -1018,11 +1284,9 @@ def create_empty_chart(message: str):
         font=dict(size=14, color="#888888")
     )
     fig.update_layout(
-        template="plotly_dark",
-        paper_bgcolor='rgba(26, 26, 40, 0.8)',
-        height=350,
         xaxis=dict(visible=False),
-        yaxis=dict(visible=False)
+        yaxis=dict(visible=False),
+        showlegend=False
     )
     return fig
 
@@ -1056,17 +1320,20 @@ def show_portfolio_analytics():
 
     st.markdown("---")
 
+    # Both charts read one cached returns matrix; the figures themselves are cached per ticker set
+    tickers = tuple(portfolio.get_unique_tickers())
+
     # 2x2 grid of charts
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("### Rolling Beta by Position")
-        fig = create_multi_beta_chart(portfolio)
+        fig = cached_chart(create_multi_beta_chart, tickers)
         st.plotly_chart(fig, use_container_width=True)
 
     with col2:
         st.markdown("### Correlation Matrix")
-        fig = create_correlation_matrix(portfolio)
+        fig = cached_chart(create_correlation_matrix, tickers)
         st.plotly_chart(fig, use_container_width=True)
 
     col1, col2 = st.columns(2)
@@ -1084,84 +1351,115 @@ def show_portfolio_analytics():
     if analytics.alerts:
         st.markdown("---")
         st.markdown("### ⚠️ Alerts")
-        for alert in analytics.alerts:
-            st.warning(alert)
+        st.warning("\n\n".join(analytics.alerts))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _returns_matrix(tickers: tuple) -> pd.DataFrame:
+    """float32 log returns of tickers + SPY over 1y, computed once for the analytics charts"""
+    prices = _download_prices(tuple(sorted(set(tickers) | {'SPY'})), '1y')
+    # A failed symbol comes back as an all-NaN column - drop it before the row dropna empties the frame
+    prices = prices.dropna(axis=1, how='all').dropna()
+    if prices.shape[1] < 2:
+        raise ChartUnavailable("Not enough price history to compare positions")
 
+    R = log_returns(prices.to_numpy())
+    keep = np.isfinite(R).all(axis=1)
+    if not keep.any():
+        raise ChartUnavailable("Not enough price history to compare positions")
+    return pd.DataFrame(R[keep], index=prices.index[1:][keep], columns=prices.columns)
 
-def create_multi_beta_chart(portfolio: CentralPortfolio):
-    """Create chart with beta for each position"""
+
+def create_multi_beta_chart(tickers: tuple):
+    """Create chart with beta for each position (from the shared returns matrix)"""
     try:
-        tickers = portfolio.get_unique_tickers()
         corr_analyzer = st.session_state.corr_analyzer
+        returns = _returns_matrix(tickers)
+
+        # One (T x N) matrix of rolling betas, sliced per ticker
+        betas = pd.DataFrame(
+            rolling_beta_table(returns.to_numpy(), returns['SPY'].to_numpy(),
+                               corr_analyzer.window, corr_analyzer.min_periods),
+            index=returns.index, columns=returns.columns
+        )
 
         fig = go.Figure()
 
         for ticker in tickers:
-            try:
-                beta_result = corr_analyzer.rolling_beta(ticker, 'SPY', period='1y', window=60)
-                fig.add_trace(go.Scatter(
-                    x=beta_result.rolling_beta.index,
-                    y=beta_result.rolling_beta,
-                    name=ticker,
-                    mode='lines'
-                ))
-            except:
-                pass
+            if ticker not in betas.columns:
+                continue
+            series = betas[ticker].dropna()
+            idx = _minmax_idx(series.to_numpy())
+            # WebGL - point count grows with the number of positions
+            fig.add_trace(go.Scattergl(
+                x=series.index[idx],
+                y=_f32(series.to_numpy()[idx]),
+                name=ticker,
+                mode='lines'
+            ))
 
         fig.add_hline(y=1.0, line_dash="dot", line_color="gray", opacity=0.5)
 
         fig.update_layout(
-            template="plotly_dark",
-            paper_bgcolor='rgba(26, 26, 40, 0.8)',
             height=400,
             yaxis_title="Beta vs SPY",
-            xaxis_title="Date",
-            showlegend=True
+            xaxis_title="Date"
         )
 
         return fig
 
+    except ChartUnavailable:
+        raise
     except Exception as e:
-        return create_empty_chart(f"Error: {e}")
+        raise ChartUnavailable(f"Error: {e}") from e
 
 
-def create_correlation_matrix(portfolio: CentralPortfolio):
-    """Create correlation heatmap"""
-    try:
-        tickers = portfolio.get_unique_tickers()
+# Largest heatmap that still gets per-cell value labels
+_HEATMAP_LABEL_MAX = 15
+
 
+def create_correlation_matrix(tickers: tuple):
+    """Create correlation heatmap (from the shared returns matrix)"""
+    try:
         if len(tickers) < 2:
-            return create_empty_chart("Need at least 2 positions")
+            raise ChartUnavailable("Need at least 2 positions")
 
-        corr_analyzer = st.session_state.corr_analyzer
-        prices = corr_analyzer.fetch_price_data(tickers, period='1y')
-        returns = corr_analyzer.calculate_returns(prices)
-        corr_matrix = returns.corr()
-
-        fig = go.Figure(data=go.Heatmap(
-            z=corr_matrix.values,
-            x=corr_matrix.columns,
-            y=corr_matrix.index,
+        returns = _returns_matrix(tickers)
+        names = [t for t in tickers if t in returns.columns]  # Skip failed downloads
+        if len(names) < 2:
+            raise ChartUnavailable("Need at least 2 positions with price history")
+
+        # Two decimals is all the heatmap shows; float32 keeps the payload a compact typed array
+        corr = np.round(corr_matrix(returns[names].to_numpy()), 2).astype(np.float32)
+
+        heatmap = dict(
+            z=corr,
+            x=names,
+            y=names,
             colorscale='RdYlGn',
             zmid=0,
-            text=corr_matrix.values,
-            texttemplate='%{text:.2f}',
-            textfont={"size": 10},
+            hoverinfo='x+y+z',
             colorbar=dict(title="Correlation")
-        ))
+        )
+        # Per-cell labels only while they stay readable - N² text nodes get slow past that
+        if len(names) <= _HEATMAP_LABEL_MAX:
+            heatmap.update(text=corr, texttemplate='%{text:.2f}', textfont={"size": 10})
+
+        fig = go.Figure(data=go.Heatmap(**heatmap))
 
         fig.update_layout(
-            template="plotly_dark",
-            paper_bgcolor='rgba(26, 26, 40, 0.8)',
             height=400,
             xaxis_title="",
-            yaxis_title=""
+            yaxis_title="",
+            showlegend=False
         )
 
         return fig
 
+    except ChartUnavailable:
+        raise
     except Exception as e:
-        return create_empty_chart(f"Error: {e}")
+        raise ChartUnavailable(f"Error: {e}") from e
 
 
 def create_greeks_chart(analytics):
@@ -1180,8 +1478,6 @@ def create_greeks_chart(analytics):
     )])
 
     fig.update_layout(
-        template="plotly_dark",
-        paper_bgcolor='rgba(26, 26, 40, 0.8)',
         height=400,
         yaxis_title="Value",
         showlegend=False
@@ -1236,48 +1532,58 @@ def show_watchlist_scanner():
 
     # Manage watchlist
     with st.expander("⚙️ Manage Watchlist"):
-        new_ticker = st.text_input("Add ticker").upper()
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("Add to Watchlist") and new_ticker:
-                watchlist.add(new_ticker)
-                st.success(f"Added {new_ticker}")
-                st.rerun()
-        with col2:
-            if st.button("Clear Watchlist"):
-                watchlist.clear()
-                st.success("Cleared")
-                st.rerun()
+        with st.form("add_watchlist_form", clear_on_submit=True, border=False):
+            new_ticker = st.text_input("Add ticker").upper()
+            add_clicked = st.form_submit_button("Add to Watchlist")
+
+        if add_clicked and new_ticker:
+            watchlist.add(new_ticker)
+            st.success(f"Added {new_ticker}")
+            st.rerun()
+
+        if st.button("Clear Watchlist"):
+            watchlist.clear()
+            st.success("Cleared")
+            st.rerun()
 
     # Show results if available
     if 'scan_results' in st.session_state and st.session_state.scan_results:
-        results = st.session_state.scan_results
+        show_scan_results(st.session_state.scan_results)
 
-        st.markdown("---")
-        st.markdown("### Scan Results")
 
-        # Summary metrics
-        col1, col2, col3 = st.columns(3)
-        with_alerts = [r for r in results if r.has_alerts]
-
-        col1.metric("Scanned", len(results))
-        col2.metric("Alerts", len(with_alerts))
-
-        if results:
-            avg_iv = np.mean([r.atm_iv for r in results if r.atm_iv])
-            col3.metric("Avg IV", f"{avg_iv*100:.1f}%")
-
-        # Display alerts
-        if with_alerts:
-            st.markdown("### ⚠️ Opportunities")
-            for result in with_alerts:
-                with st.expander(f"{result.ticker} - {len(result.alerts)} alerts"):
-                    for alert in result.alerts:
-                        st.warning(alert)
-
-                    # Quick add button
-                    if st.button(f"View {result.ticker} Details", key=f"view_{result.ticker}"):
-                        st.info(f"Add {result.ticker} to portfolio first to view details")
+@st.fragment
+def show_scan_results(results: list):
+    """
+    Scan summary and per-ticker alert panels.
+
+    A fragment, so the per-result buttons rerun only this block instead of
+    the whole page (watchlist controls and all).
+    """
+    st.markdown("---")
+    st.markdown("### Scan Results")
+
+    # Summary metrics
+    col1, col2, col3 = st.columns(3)
+    with_alerts = [r for r in results if r.has_alerts]
+
+    col1.metric("Scanned", len(results))
+    col2.metric("Alerts", len(with_alerts))
+
+    if results:
+        ivs = np.fromiter((r.atm_iv or 0.0 for r in results), dtype=np.float64, count=len(results))
+        avg_iv = ivs[ivs != 0].mean()
+        col3.metric("Avg IV", f"{avg_iv*100:.1f}%")
+
+    # Display alerts
+    if with_alerts:
+        st.markdown("### ⚠️ Opportunities")
+        for result in with_alerts:
+            with st.expander(f"{result.ticker} - {len(result.alerts)} alerts"):
+                st.warning("\n\n".join(result.alerts))
+
+                # Quick add button
+                if st.button(f"View {result.ticker} Details", key=f"view_{result.ticker}"):
+                    st.info(f"Add {result.ticker} to portfolio first to view details")
 
 
 # ============================================================================
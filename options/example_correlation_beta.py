@@ -10,6 +10,7 @@ from correlation_analysis import (
     quick_beta,
     analyze_portfolio_correlations
 )
+import numpy as np
 import matplotlib.pyplot as plt
 
 
@@ -79,8 +80,8 @@ def example_rolling_beta():
     print(f"\n--- What This Means ---")
 
     beta = beta_result.current_beta
-    alpha = beta_result.alphas[-1] * 252 * 100  # Annualized %
-    r_squared = beta_result.r_squared[-1]
+    alpha = float(beta_result.alphas[-1]) * 252 * 100  # Annualized %
+    r_squared = float(beta_result.r_squared[-1])
 
     print(f"\nBeta = {beta:.3f}")
     if beta > 1.5:
@@ -299,17 +300,16 @@ def example_sector_rotation():
         print(f"\n--- Current Sector Correlations ---")
         print(corr_matrix.correlation_matrix.round(2))
 
-        # Find least correlated sectors
-        min_corr = 1.0
-        min_pair = None
+        # Find least correlated sectors (one gather over the upper triangle)
+        labels = list(corr_matrix.correlation_matrix.columns)
+        iu = np.triu_indices(len(labels), k=1)
+        pair_corrs = corr_matrix.correlation_matrix.to_numpy()[iu]
 
-        n = len(tickers)
-        for i in range(n):
-            for j in range(i+1, n):
-                corr = corr_matrix.correlation_matrix.iloc[i, j]
-                if corr < min_corr:
-                    min_corr = corr
-                    min_pair = (tickers[i], tickers[j])
+        min_pair = None
+        if len(pair_corrs):
+            k = pair_corrs.argmin()
+            min_corr = float(pair_corrs[k])
+            min_pair = (labels[iu[0][k]], labels[iu[1][k]])
 
         if min_pair:
             print(f"\n✓ Best diversification pair:")
@@ -117,7 +117,7 @@ def example_scanner():
 
     # Add some tickers to watch
     for ticker in ['SPY', 'QQQ', 'AAPL', 'MSFT', 'NVDA']:
-        if ticker not in watchlist.tickers:
+        if ticker not in watchlist:
             watchlist.add(ticker)
 
     print(f"\nWatchlist: {', '.join(watchlist.tickers)}")
@@ -80,6 +80,20 @@ class DistributionForecaster:
         self.r = risk_free_rate
         self.analyzer = OptionsAnalyzer(risk_free_rate)
     
+    def fit(self, ticker: str, expiration_index: int = 0) -> Optional[ImpliedDistribution]:
+        """
+        Fit only the implied distribution for one expiration.
+        
+        Skips the forecast statistics - use when just the density curve is needed.
+        """
+        try:
+            results = self.analyzer.analyze_ticker(ticker, expiration_index)
+        except Exception as e:
+            print(f"Error analyzing {ticker}: {e}")
+            return None
+        
+        return results['implied_distribution']
+    
     def forecast_from_distribution(self, ticker: str, 
                                     expiration_index: int = 0) -> Optional[Forecast]:
         """
@@ -149,11 +163,20 @@ class DistributionForecaster:
     
     def monte_carlo_forecast(self, ticker: str, days: int = 30,
                              num_simulations: int = 10000,
-                             expiration_index: int = 0) -> Dict:
+                             expiration_index: int = 0,
+                             seed: int = 42,
+                             return_paths: bool = False) -> Dict:
         """
         Monte Carlo simulation using implied volatility.
         
         Uses geometric Brownian motion with IV from options market.
+        The same seed always gives the same paths.
+        
+        Only terminal prices are needed for the statistics, and under GBM the
+        sum of n_steps i.i.d. daily log returns is itself one normal draw, so
+        by default each simulation draws its terminal price directly (O(sims)
+        memory). Pass return_paths=True to simulate and return the full
+        (num_simulations x days) price paths for visualization.
         """
         try:
             results = self.analyzer.analyze_ticker(ticker, expiration_index)
@@ -175,31 +198,40 @@ class DistributionForecaster:
         T = days / 252
         n_steps = days
         
-        # Generate paths
-        np.random.seed(42)  # For reproducibility
-        
-        # Random shocks
-        Z = np.random.standard_normal((num_simulations, n_steps))
+        # Generate paths (local generator, so the global RNG state is untouched)
+        rng = np.random.default_rng(seed)
         
         # Drift adjusted for risk-neutral
         drift = (self.r - 0.5 * sigma**2) * dt
         diffusion = sigma * np.sqrt(dt)
         
-        # Simulate log returns
-        log_returns = drift + diffusion * Z
-        
-        # Cumulative returns
-        log_paths = np.cumsum(log_returns, axis=1)
-        
-        # Price paths
-        price_paths = current_price * np.exp(log_paths)
-        
-        # Terminal prices
-        terminal_prices = price_paths[:, -1]
+        if return_paths:
+            # Random shocks
+            Z = rng.standard_normal((num_simulations, n_steps), dtype=np.float32)
+            
+            # Log returns -> cumulative log returns -> price paths, all in the
+            # shock buffer so no (num_simulations x n_steps) temporaries are made
+            price_paths = Z
+            price_paths *= diffusion
+            price_paths += drift
+            np.cumsum(price_paths, axis=1, out=price_paths)
+            np.exp(price_paths, out=price_paths)
+            price_paths *= current_price
+            
+            # Terminal prices (paths are float32; statistics are taken in float64)
+            terminal_prices = price_paths[:, -1].astype(np.float64)
+        else:
+            # Terminal log return ~ N(drift * n, diffusion² * n)
+            price_paths = None
+            terminal_prices = rng.standard_normal(num_simulations)
+            terminal_prices *= diffusion * np.sqrt(n_steps)
+            terminal_prices += drift * n_steps
+            np.exp(terminal_prices, out=terminal_prices)
+            terminal_prices *= current_price
         
         # Statistics
         percentiles = [1, 5, 10, 25, 50, 75, 90, 95, 99]
-        pct_values = np.percentile(terminal_prices, percentiles)
+        pct_values = np.quantile(terminal_prices, np.array(percentiles) / 100)
         
         return {
             'ticker': ticker,
@@ -214,7 +246,7 @@ class DistributionForecaster:
             'prob_down': np.mean(terminal_prices < current_price),
             'max': np.max(terminal_prices),
             'min': np.min(terminal_prices),
-            'paths': price_paths  # Full paths for visualization
+            'paths': price_paths  # Full paths for visualization (None unless return_paths)
         }
     
     def scenario_analysis(self, ticker: str, targets: List[float],
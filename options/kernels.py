@@ -0,0 +1,201 @@
+"""
+Numerical Kernels
+Vectorized rolling-window primitives shared by the dashboard and analytics modules.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Optional, Tuple
+
+
+def _prefix_sum(a: np.ndarray) -> np.ndarray:
+    """Cumulative sum (down axis 0) with a leading zero, so window sums are csum[i+w] - csum[i]"""
+    csum = np.empty((len(a) + 1,) + a.shape[1:])
+    csum[0] = 0.0
+    np.cumsum(a, axis=0, out=csum[1:])
+    return csum
+
+
+def _window_mean(csum: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean of each full window from a prefix sum (NaN until the window fills)"""
+    n = len(csum) - 1
+    out = np.full(n, np.nan)
+    if 0 < window <= n:
+        out[window - 1:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+
+def rolling_mean(a: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing rolling mean, equivalent to Series.rolling(window).mean().
+
+    O(N) running-sum algorithm: one cumulative sum, then add-one/subtract-one
+    differences instead of re-summing every window.
+    """
+    a = np.asarray(a, dtype=np.float64)
+    return _window_mean(_prefix_sum(a), window)
+
+
+def dual_rolling_mean(a: np.ndarray, w1: int, w2: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Two rolling means (e.g. MA20/MA50) from a single pass over the data"""
+    csum = _prefix_sum(np.asarray(a, dtype=np.float64))
+    return _window_mean(csum, w1), _window_mean(csum, w2)
+
+
+def rolling_beta_table(R: np.ndarray, f: np.ndarray, window: int,
+                       min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Rolling beta of every column of R (T x N) against the market series f (T,).
+
+    Table-mode kernel: prefix sums of f, f², R and R·f give each trailing
+    window's Cov(R_i, f) / Var(f) for all N columns at once, with the market
+    statistics computed a single time. Rows with fewer than min_periods
+    observations (default: window) are NaN.
+
+    Inputs and output are float32; the prefix sums accumulate in float64
+    because window sums are differences of running totals, which would
+    cancel badly at single precision.
+    """
+    R = np.asarray(R, dtype=np.float32)
+    f = np.asarray(f, dtype=np.float32)
+    min_periods = window if min_periods is None else min_periods
+
+    # Trailing window [start, end) for every row, shorter while the window fills
+    end = np.arange(1, len(f) + 1)
+    start = np.maximum(end - window, 0)
+    n = (end - start).astype(np.float64)
+
+    def window_sum(a):
+        csum = _prefix_sum(a)
+        return csum[end] - csum[start]
+
+    sum_f = window_sum(f)
+    var_f = window_sum(f * f) - sum_f * sum_f / n
+    cov = window_sum(R * f[:, None]) - window_sum(R) * (sum_f / n)[:, None]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beta = cov / var_f[:, None]
+    beta[n < min_periods] = np.nan
+    return beta.astype(np.float32)
+
+
+def rolling_regression(y: np.ndarray, x: np.ndarray, window: int,
+                       min_periods: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Trailing-window OLS of y on x: (beta, alpha, r_squared) for every row.
+
+    Same running-sum approach as rolling_beta_table - the centred sums
+    Sxx, Syy and Sxy of each window come from prefix-sum differences, so
+    the whole series is a handful of vectorized passes instead of a fit
+    per window. R² = Sxy² / (Sxx·Syy), which equals 1 - SS_res/SS_tot for
+    the fitted line (0 where y is flat). Rows with fewer than min_periods
+    observations (default: window) are NaN.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    x = np.asarray(x, dtype=np.float64)
+    min_periods = window if min_periods is None else min_periods
+
+    end = np.arange(1, len(x) + 1)
+    start = np.maximum(end - window, 0)
+    n = (end - start).astype(np.float64)
+
+    def window_sum(a):
+        csum = _prefix_sum(a)
+        return csum[end] - csum[start]
+
+    sx, sy = window_sum(x), window_sum(y)
+    sxx = window_sum(x * x) - sx * sx / n
+    syy = window_sum(y * y) - sy * sy / n
+    sxy = window_sum(x * y) - sx * sy / n
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beta = sxy / sxx
+        alpha = (sy - beta * sx) / n
+        r_squared = np.where(syy > 0, sxy * sxy / (sxx * syy), 0.0)
+
+    short = n < min_periods
+    beta[short] = alpha[short] = r_squared[short] = np.nan
+    return beta, alpha, r_squared
+
+
+def rolling_corr_table(R: np.ndarray, window: int,
+                       min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Trailing-window correlation of every pair of columns of R (T x N).
+
+    Returns a (T x N x N) float32 array. Prefix sums of R and of the
+    per-row outer products R_t R_tᵀ give every window's centred
+    cross-products at once, so all N² pairs cost a few vectorized passes
+    rather than one rolling pass per pair. Rows with fewer than
+    min_periods observations (default: window) are NaN.
+    """
+    R = np.asarray(R, dtype=np.float64)
+    min_periods = window if min_periods is None else min_periods
+
+    end = np.arange(1, len(R) + 1)
+    start = np.maximum(end - window, 0)
+    n = (end - start).astype(np.float64)
+
+    def window_sum(a):
+        csum = _prefix_sum(a)
+        return csum[end] - csum[start]
+
+    s = window_sum(R)
+    sxy = window_sum(R[:, :, None] * R[:, None, :]) - s[:, :, None] * s[:, None, :] / n[:, None, None]
+    var = np.einsum('tii->ti', sxy)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = sxy / np.sqrt(var[:, :, None] * var[:, None, :])
+    corr[n < min_periods] = np.nan
+    return corr.astype(np.float32)
+
+
+def rolling_corr(x: np.ndarray, y: np.ndarray, window: int,
+                 min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Trailing-window correlation of two series, equivalent to
+    x.rolling(window, min_periods).corr(y).
+
+    Both series are front-padded with window-1 NaNs and viewed as (T x window)
+    strided windows, so every row's centred cross-products come from a few
+    whole-array reductions with no per-window Python call. Centring inside
+    each window keeps it exact where running sums would cancel. Pairs with
+    either side missing are ignored; rows with fewer than min_periods
+    observations (default: window) are NaN.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    min_periods = window if min_periods is None else min_periods
+
+    valid = np.isfinite(x) & np.isfinite(y)
+    pad = np.full(window - 1, np.nan)
+    xw = sliding_window_view(np.concatenate([pad, np.where(valid, x, np.nan)]), window)
+    yw = sliding_window_view(np.concatenate([pad, np.where(valid, y, np.nan)]), window)
+
+    n = np.isfinite(xw).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xm = xw - np.nansum(xw, axis=1, keepdims=True) / n[:, None]
+        ym = yw - np.nansum(yw, axis=1, keepdims=True) / n[:, None]
+        num = np.nansum(xm * ym, axis=1)
+        corr = num / np.sqrt(np.nansum(xm * xm, axis=1) * np.nansum(ym * ym, axis=1))
+    corr[n < min_periods] = np.nan
+    return corr
+
+
+def log_returns(P: np.ndarray) -> np.ndarray:
+    """Log returns of a (T x N) price matrix as float32 (T-1 rows; inf/NaN left for the caller to mask)"""
+    P = np.asarray(P, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.log(P[1:] / P[:-1]).astype(np.float32)
+
+
+def corr_matrix(R: np.ndarray) -> np.ndarray:
+    """
+    Correlation matrix of the columns of a (T x N) returns matrix, in float32.
+
+    Rows with any non-finite value are dropped first, and the buffer is made
+    column-major so each column is contiguous for corrcoef.
+    """
+    R = np.asarray(R, dtype=np.float32)
+    R = R[np.isfinite(R).all(axis=1)]
+    return np.corrcoef(np.asfortranarray(R), rowvar=False, dtype=np.float32)
@@ -27,6 +27,11 @@ class Position:
     expiration: Optional[str] = None  # For options
     notes: str = ""
     
+    @property
+    def multiplier(self) -> int:
+        """Shares per unit: 1 for stock, 100 per option contract"""
+        return 1 if self.position_type == 'stock' else 100
+    
     def to_dict(self) -> dict:
         return asdict(self)
     
@@ -121,18 +126,19 @@ class Portfolio:
     def get_current_prices(self) -> Dict[str, float]:
         """Fetch current prices for all tickers"""
         tickers = self.get_unique_tickers()
-        prices = {}
+        if not tickers:
+            return {}
         
-        for ticker in tickers:
-            try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period='1d')
-                if not hist.empty:
-                    prices[ticker] = hist['Close'].iloc[-1]
-            except Exception as e:
-                print(f"Error fetching {ticker}: {e}")
+        # One multi-symbol request instead of a round-trip per ticker
+        try:
+            closes = yf.download(tickers, period='1d', threads=True,
+                                 progress=False, auto_adjust=True)['Close']
+        except Exception as e:
+            print(f"Error fetching prices: {e}")
+            return {}
         
-        return prices
+        last = closes.ffill().iloc[-1] if not closes.empty else pd.Series(dtype=float)
+        return {ticker: float(price) for ticker, price in last.items() if pd.notna(price)}
     
     def get_option_current_price(self, ticker: str, strike: float,
                                   expiration: str, option_type: str) -> float:
@@ -173,47 +179,44 @@ class Portfolio:
             return pd.DataFrame()
 
         prices = self.get_current_prices()
+        positions = self.positions
 
-        records = []
-        for i, pos in enumerate(self.positions):
-            if pos.position_type == 'stock':
-                # Stock positions
-                current_price = prices.get(pos.ticker, 0)
-                market_value = current_price * pos.quantity
-                cost_basis = pos.entry_price * pos.quantity
-                display_price = current_price
-
-            else:
-                # Option positions - fetch real option price
-                current_option_price = self.get_option_current_price(
-                    pos.ticker, pos.strike, pos.expiration, pos.position_type
-                )
-
-                # Options are priced per contract (100 shares)
-                market_value = current_option_price * pos.quantity * 100
-                cost_basis = pos.entry_price * pos.quantity * 100
-                display_price = current_option_price
+        # Current quote per position: stock close, or the option's live price
+        current = np.fromiter(
+            (prices.get(pos.ticker, 0) if pos.position_type == 'stock'
+             else self.get_option_current_price(pos.ticker, pos.strike,
+                                                pos.expiration, pos.position_type)
+             for pos in positions),
+            dtype=np.float64, count=len(positions)
+        )
 
-            pnl = market_value - cost_basis
-            pnl_pct = (pnl / cost_basis * 100) if cost_basis != 0 else 0
+        # Everything derived is column arithmetic (options are priced per 100-share contract)
+        quantity = [pos.quantity for pos in positions]
+        multiplier = [pos.multiplier for pos in positions]
+        entry = np.array([pos.entry_price for pos in positions], dtype=np.float64)
+        units = np.array(quantity, dtype=np.float64) * multiplier
 
-            records.append({
-                'index': i,
-                'ticker': pos.ticker,
-                'type': pos.position_type,
-                'quantity': pos.quantity,
-                'entry_price': pos.entry_price,
-                'current_price': display_price,
-                'strike': pos.strike,
-                'expiration': pos.expiration,
-                'cost_basis': cost_basis,
-                'market_value': market_value,
-                'pnl': pnl,
-                'pnl_pct': pnl_pct,
-                'entry_date': pos.entry_date
-            })
+        market_value = current * units
+        cost_basis = entry * units
+        pnl = market_value - cost_basis
+        pnl_pct = np.divide(pnl * 100, cost_basis, out=np.zeros_like(pnl), where=cost_basis != 0)
 
-        return pd.DataFrame(records)
+        return pd.DataFrame({
+            'index': np.arange(len(positions)),
+            'ticker': [pos.ticker for pos in positions],
+            'type': [pos.position_type for pos in positions],
+            'quantity': quantity,
+            'multiplier': multiplier,
+            'entry_price': entry,
+            'current_price': current,
+            'strike': [pos.strike for pos in positions],
+            'expiration': [pos.expiration for pos in positions],
+            'cost_basis': cost_basis,
+            'market_value': market_value,
+            'pnl': pnl,
+            'pnl_pct': pnl_pct,
+            'entry_date': [pos.entry_date for pos in positions]
+        })
     
     def get_portfolio_greeks(self, analyzer) -> Dict:
         """
@@ -242,7 +245,7 @@ class Portfolio:
                     
                     if not matching.empty:
                         row = matching.iloc[0]
-                        multiplier = pos.quantity * 100  # 100 shares per contract
+                        multiplier = pos.quantity * pos.multiplier  # 100 shares per contract
                         
                         total_delta += row.get('delta', 0) * multiplier
                         total_gamma += row.get('gamma', 0) * multiplier
@@ -258,9 +261,10 @@ class Portfolio:
             'vega': total_vega
         }
     
-    def summary(self) -> Dict:
-        """Get portfolio summary"""
-        pnl_df = self.calculate_pnl()
+    def summary(self, pnl_df: Optional[pd.DataFrame] = None) -> Dict:
+        """Get portfolio summary (pass pnl_df to reuse an existing P&L frame)"""
+        if pnl_df is None:
+            pnl_df = self.calculate_pnl()
         
         if pnl_df.empty:
             return {
@@ -271,16 +275,21 @@ class Portfolio:
                 'total_pnl_pct': 0
             }
         
+        # Each column reduced once
+        total_cost = pnl_df['cost_basis'].sum()
+        pnl = pnl_df['pnl'].to_numpy()
+        total_pnl = pnl.sum()
+        
         return {
             'total_positions': len(self.positions),
             'unique_tickers': len(self.get_unique_tickers()),
             'total_value': pnl_df['market_value'].sum(),
-            'total_cost': pnl_df['cost_basis'].sum(),
-            'total_pnl': pnl_df['pnl'].sum(),
-            'total_pnl_pct': (pnl_df['pnl'].sum() / pnl_df['cost_basis'].sum() * 100 
-                             if pnl_df['cost_basis'].sum() != 0 else 0),
-            'winners': len(pnl_df[pnl_df['pnl'] > 0]),
-            'losers': len(pnl_df[pnl_df['pnl'] < 0])
+            'total_cost': total_cost,
+            'total_pnl': total_pnl,
+            'total_pnl_pct': (total_pnl / total_cost * 100 
+                             if total_cost != 0 else 0),
+            'winners': int((pnl > 0).sum()),
+            'losers': int((pnl < 0).sum())
         }
     
     def __repr__(self):
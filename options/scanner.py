@@ -6,8 +6,9 @@ Monitors a list of tickers for unusual options activity and distribution changes
 import json
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 import yfinance as yf
@@ -71,6 +72,7 @@ class Watchlist:
     def __init__(self, watchlist_file: str = WATCHLIST_FILE):
         self.watchlist_file = watchlist_file
         self.tickers: List[str] = []
+        self._set: Set[str] = set()  # Mirrors tickers for O(1) membership
         self.scan_history: Dict[str, List[ScanResult]] = {}
         self.load()
     
@@ -87,6 +89,7 @@ class Watchlist:
             # Default watchlist
             self.tickers = ['SPY', 'QQQ', 'AAPL', 'MSFT', 'TSLA', 'NVDA', 'AMD', 'META']
             self.save()
+        self._set = set(self.tickers)
     
     def save(self):
         """Save watchlist to file"""
@@ -101,22 +104,29 @@ class Watchlist:
     def add(self, ticker: str):
         """Add ticker to watchlist"""
         ticker = ticker.upper()
-        if ticker not in self.tickers:
-            self.tickers.append(ticker)
-            self.save()
+        if ticker in self._set:
+            return
+        self._set.add(ticker)
+        self.tickers.append(ticker)
+        self.save()
     
     def remove(self, ticker: str):
         """Remove ticker from watchlist"""
         ticker = ticker.upper()
-        if ticker in self.tickers:
+        if ticker in self._set:
+            self._set.discard(ticker)
             self.tickers.remove(ticker)
             self.save()
     
     def clear(self):
         """Clear watchlist"""
         self.tickers = []
+        self._set.clear()
         self.save()
 
+    def __contains__(self, ticker: str) -> bool:
+        return ticker.upper() in self._set
+
 
 class OptionsScanner:
     """
@@ -268,10 +278,14 @@ class OptionsScanner:
         List of ScanResult objects, sorted by alert score
         """
         results = []
+        tickers = list(watchlist.tickers)
+
+        # Scans are I/O bound (yfinance) - overlap them; history dicts are keyed per ticker
+        with ThreadPoolExecutor(max_workers=max(1, min(16, len(tickers)))) as pool:
+            scanned = list(pool.map(lambda t: self.scan_ticker(t, expiration_index), tickers))
 
-        for ticker in watchlist.tickers:
+        for ticker, result in zip(tickers, scanned):
             print(f"Scanning {ticker}...", end=" ")
-            result = self.scan_ticker(ticker, expiration_index)
             if result:
                 results.append(result)
                 if result.has_alerts:
@@ -21,6 +21,10 @@ const config: Config = {
           muted: '#9ca3af',
         },
       },
+      // Preflight's own universal reset applies this, so no extra `*` rule is needed
+      borderColor: {
+        DEFAULT: '#2a2a38',
+      },
       fontFamily: {
         mono: ['JetBrains Mono', 'Courier New', 'monospace'],
       },